@@ -0,0 +1,77 @@
+"""
+ASGI middleware for the API.
+"""
+import zlib
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Largest body a gzip request may inflate to; bounds memory against compression bombs
+MAX_DECOMPRESSED_BODY_BYTES = 64 * 1024 * 1024
+
+
+class GZipRequestMiddleware:
+    """
+    Decompresses request bodies sent with `Content-Encoding: gzip`.
+
+    Starlette's GZipMiddleware only compresses responses; this is the
+    request-side counterpart so large uploads can travel compressed.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int = MAX_DECOMPRESSED_BODY_BYTES):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = dict(scope["headers"]).get(b"content-encoding", b"")
+        if encoding.lower() != b"gzip":
+            await self.app(scope, receive, send)
+            return
+
+        # Stream-decompress as chunks arrive; wbits=31 expects a gzip header
+        decompressor = zlib.decompressobj(wbits=31)
+        parts = []
+        size = 0
+        more_body = True
+        try:
+            while more_body and size <= self.max_body_size:
+                message = await receive()
+                if message["type"] != "http.request":
+                    break
+                # Ask for one byte past the remaining budget: getting it back means the limit is exceeded
+                parts.append(decompressor.decompress(message.get("body", b""), self.max_body_size - size + 1))
+                size += len(parts[-1])
+                more_body = message.get("more_body", False)
+            if size <= self.max_body_size:
+                parts.append(decompressor.flush())
+                size += len(parts[-1])
+                if not decompressor.eof:
+                    raise zlib.error("truncated gzip body")
+        except zlib.error:
+            response = JSONResponse({"detail": "Invalid gzip request body"}, status_code=400)
+            await response(scope, receive, send)
+            return
+        if size > self.max_body_size:
+            response = JSONResponse({"detail": "Decompressed request body too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+        body = b"".join(parts)
+
+        headers = [(k, v) for k, v in scope["headers"] if k not in (b"content-encoding", b"content-length")]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        scope = {**scope, "headers": headers}
+
+        sent = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, receive_decompressed, send)
@@ -6,13 +6,14 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from app.services.chunk_service import ChunkService
 from app.schemas.chunk_schemas import (
     ChunkCreateRequest, 
+    ChunkBulkCreateRequest,
     ChunkUpdateRequest, 
     ChunkResponse
 )
 from app.api.dependencies import get_chunk_service
 from app.exceptions import NotFoundError, ValidationError, IndexError, EmbeddingError
 from uuid import UUID
-from typing import Optional
+from typing import Optional, List
 
 # Create the router with prefix for nested resources
 router = APIRouter(prefix="/libraries/{library_id}/chunks", tags=["chunks"])
@@ -55,6 +56,7 @@ async def create_chunk(
     - **metadata**: Optional metadata dictionary for the chunk
     - **document_id**: Optional document ID (default None, creates new document if not provided)
     - **document_metadata**: Optional metadata for new document creation (default {})
+    - **embedding**: Optional precomputed embedding (default None, generated from text if not provided)
     
     Returns the created chunk with its generated ID.
     """
@@ -64,14 +66,48 @@ async def create_chunk(
             text=request.text,
             metadata=request.metadata,
             document_id=request.document_id,
-            document_metadata=request.document_metadata
+            document_metadata=request.document_metadata,
+            embedding=request.embedding
         )
         return ChunkResponse.from_domain(chunk)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except EmbeddingError as e:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
-    except IndexError as e:
+    except (IndexError, ValidationError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+# Creating many chunks at once
+@router.post("/bulk", 
+             response_model=List[ChunkResponse], 
+             status_code=status.HTTP_201_CREATED)
+async def create_chunks_bulk(
+    library_id: UUID,
+    request: ChunkBulkCreateRequest,
+    service: ChunkService = Depends(get_chunk_service)
+) -> List[ChunkResponse]:
+    """
+    Create many chunks in a library in a single request.
+    
+    - **items**: List of chunks, each with the same fields as a single chunk create (required)
+    - **defer_index**: Skip per-chunk index updates; chunks become searchable after the next index build (default False)
+    
+    Returns the created chunks in request order.
+    """
+    try:
+        chunks = service.create_many(
+            library_id=library_id,
+            items=[item.model_dump() for item in request.items],
+            defer_index=request.defer_index
+        )
+        return [ChunkResponse.from_domain(chunk) for chunk in chunks]
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except EmbeddingError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except (IndexError, ValidationError) as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
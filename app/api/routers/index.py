@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, status, HTTPException
 from app.services.index_service import IndexService
-from app.schemas.index_schemas import IndexResponse, SearchRequest, SearchResponse, SearchResult
+from app.schemas.index_schemas import IndexResponse, IndexBuildJobResponse, SearchRequest, SearchResponse, SearchResult
 from app.schemas.chunk_schemas import ChunkResponse
 from app.api.dependencies import get_index_service
-from app.exceptions import IndexError
+from app.exceptions import IndexError, NotFoundError
 from uuid import UUID
 
 router = APIRouter(prefix="/libraries/{library_id}", tags=["index"])
@@ -24,6 +24,45 @@ async def index_library(
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+@router.post("/index/jobs", 
+             response_model=IndexBuildJobResponse, 
+             status_code=status.HTTP_202_ACCEPTED)
+async def start_index_build(
+    library_id: UUID,
+    background_tasks: BackgroundTasks,
+    service: IndexService = Depends(get_index_service)
+) -> IndexBuildJobResponse:
+    """
+    Start building a library's index in the background.
+    
+    Returns immediately with the build job; poll `GET /index/status` until it is `ready` or `failed`.
+    """
+    try:
+        job = service.start_build_job(library_id)
+        background_tasks.add_task(service.run_build_job, library_id, job.id)
+        return IndexBuildJobResponse.from_domain(job)
+    except IndexError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+@router.get("/index/status", response_model=IndexBuildJobResponse)
+async def get_index_build_status(
+    library_id: UUID,
+    service: IndexService = Depends(get_index_service)
+) -> IndexBuildJobResponse:
+    """
+    Get the latest background index build job for a library.
+    """
+    try:
+        return IndexBuildJobResponse.from_domain(service.get_build_job(library_id))
+    except IndexError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
 @router.post("/search", response_model=SearchResponse)
 async def search_library(
     library_id: UUID,
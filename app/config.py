@@ -35,6 +35,7 @@ class IndexConfig:
     KMEANS = {
         "max_iters": 50,        # Maximum number of iterations
         "tolerance": 1e-4,      # Convergence tolerance
+        "float32_sims": False,  # Compute assignment similarities in float32 (half the GEMM bandwidth)
     }
 
 
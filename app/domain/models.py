@@ -14,6 +14,35 @@ class IndexModel(Enum):
     IVF = "ivf"
     NSW = "nsw"
 
+class IndexBuildStatus(Enum):
+    """
+    Enum for the lifecycle states of a background index build.
+    """
+    PENDING = "pending"
+    BUILDING = "building"
+    READY = "ready"
+    FAILED = "failed"
+
+class IndexBuildJobModel(BaseModel):
+    """
+    A background index build for a library.
+    
+    Attributes:
+        id: UUID
+        library_id: UUID
+        status: IndexBuildStatus enum (default: PENDING)
+        detail: Optional[str] (error message when the build failed)
+        created_at: datetime
+        finished_at: Optional[datetime]
+    """
+    id: UUID = Field(default_factory=uuid4)
+    library_id: UUID
+    status: IndexBuildStatus = Field(default=IndexBuildStatus.PENDING)
+    detail: Optional[str] = Field(default=None)
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = Field(default=None)
+
 class ChunkModel(BaseModel):
     """
     A chunk of text with an embedding and metadata.
@@ -2,6 +2,8 @@ from typing import Callable, List, Tuple, Dict, Any, Optional, Set
 from uuid import UUID
 import heapq
 
+import numpy as np
+
 from app.indexes.base import BaseIndex
 from app.indexes.filters.engine import Filters
 from app.utils.similarity import cosine_similarity
@@ -27,7 +29,7 @@ class IVFIndex(BaseIndex, Filters):
         self._unprocessed_chunks: Dict[UUID, List[float]] = {}
         self._metadata: Dict[UUID, Dict[str, Any]] = {}
 
-        self._centroids: List[List[float]] = []
+        self._centroids: np.ndarray = np.empty((0, 0))
         self._cluster_members: List[Set[UUID]] = []
 
         self._lock = rwlock.RWLockFair()
@@ -66,7 +68,7 @@ class IVFIndex(BaseIndex, Filters):
                 self._unprocessed_chunks = {}
 
             if not self._chunks:
-                self._centroids = []
+                self._centroids = np.empty((0, 0))
                 self._cluster_members = []
                 return True
 
@@ -81,15 +83,15 @@ class IVFIndex(BaseIndex, Filters):
 
             self._kmeans = KMeans(effective_k)
 
-            centroids, labels = self._kmeans.fit(embeddings)
-            if not centroids:
-                self._centroids = []
+            centroids, labels = self._kmeans.fit(embeddings, return_arrays=True)
+            if len(centroids) == 0:
+                self._centroids = np.empty((0, 0))
                 self._cluster_members = []
                 return True
 
             k = len(centroids)
             cluster_members = [set() for _ in range(k)]
-            for cid, lbl in zip(chunk_ids, labels):
+            for cid, lbl in zip(chunk_ids, labels.tolist()):
                 if 0 <= lbl < k:
                     cluster_members[lbl].add(cid)
 
@@ -107,7 +109,7 @@ class IVFIndex(BaseIndex, Filters):
         with self._lock.gen_rlock():
             fetch_count = k * self.multiplier if filters else k
 
-            if not self._centroids:
+            if len(self._centroids) == 0:
                 search_space = {**self._chunks, **self._unprocessed_chunks}
                 results = self._brute_force_search(search_space, query_embedding, fetch_count, filters)
                 return results[:k]
@@ -1,6 +1,10 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routers import libraries, documents, chunks, index
+from app.api.middleware import GZipRequestMiddleware
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -17,6 +21,18 @@ def create_app() -> FastAPI:
             "version": "1.0"
         }
     
+    @app.exception_handler(RequestValidationError)
+    async def validation_exception_handler(request: Request, exc: RequestValidationError):
+        # Same body as FastAPI's default handler, but orjson encodes echoed NaN/inf inputs
+        # as null instead of failing (e.g. a rejected non-finite embedding)
+        return ORJSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={"detail": jsonable_encoder(exc.errors())},
+        )
+    
+    # Accept gzip-compressed request bodies (large bulk uploads)
+    app.add_middleware(GZipRequestMiddleware)
+
     # Include routers
     app.include_router(libraries.router, prefix="/v1")
     app.include_router(documents.router, prefix="/v1")
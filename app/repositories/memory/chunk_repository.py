@@ -46,4 +46,8 @@ class InMemoryChunkRepository(BaseRepository):
     
     def get_all(self) -> List[ChunkModel]:
         with self._lock.gen_rlock():
-            return [chunk.model_copy(deep=True) for chunk in self._chunks.values()]
\ No newline at end of file
+            return [chunk.model_copy(deep=True) for chunk in self._chunks.values()]
+
+    def reset(self) -> None:
+        with self._lock.gen_wlock():
+            self._chunks.clear()
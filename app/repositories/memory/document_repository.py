@@ -74,4 +74,8 @@ class InMemoryDocumentRepository(BaseRepository):
             if document_id not in self._documents: 
                 raise NotFoundError(f"Document with id {document_id} not found.")
             
-            return list(self._documents[document_id].chunks)
\ No newline at end of file
+            return list(self._documents[document_id].chunks)
+
+    def reset(self) -> None:
+        with self._lock.gen_wlock():
+            self._documents.clear()
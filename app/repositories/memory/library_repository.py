@@ -75,4 +75,8 @@ class InMemoryLibraryRepository(BaseRepository):
             if library_id not in self._libraries:
                 raise NotFoundError(f"Library with id {library_id} not found.")
         
-            return list(self._libraries[library_id].documents)
\ No newline at end of file
+            return list(self._libraries[library_id].documents)
+
+    def reset(self) -> None:
+        with self._lock.gen_wlock():
+            self._libraries.clear()
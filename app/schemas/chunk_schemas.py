@@ -2,7 +2,7 @@
 Chunk API schemas for request/response models.
 """
 from pydantic import BaseModel, Field, validator, model_validator
-from typing import Dict, Any, Optional, List
+from typing import Annotated, Dict, Any, Optional, List
 from uuid import UUID
 from datetime import datetime
 
@@ -12,6 +12,12 @@ class ChunkCreateRequest(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Chunk metadata")
     document_id: Optional[UUID] = Field(None, description="Document ID (creates new document if not provided)")
     document_metadata: Dict[str, Any] = Field(default_factory=dict, description="Metadata for new document if document_id not provided")
+    embedding: Optional[List[Annotated[float, Field(allow_inf_nan=False)]]] = Field(None, min_length=1, description="Precomputed embedding (generated from text if not provided)")
+
+class ChunkBulkCreateRequest(BaseModel):
+    """Request schema for creating many chunks in one request."""
+    items: List[ChunkCreateRequest] = Field(..., min_length=1, description="Chunks to create")
+    defer_index: bool = Field(False, description="Add chunks to the index on the next index build instead of on insert")
 
 class ChunkUpdateRequest(BaseModel):
     """Request schema for updating a chunk."""
@@ -13,6 +13,26 @@ class IndexResponse(BaseModel):
     message: str
     last_indexed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class IndexBuildJobResponse(BaseModel):
+    job_id: UUID
+    library_id: UUID
+    status: str
+    detail: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    @classmethod
+    def from_domain(cls, job) -> "IndexBuildJobResponse":
+        """Convert domain model to response schema."""
+        return cls(
+            job_id=job.id,
+            library_id=job.library_id,
+            status=job.status.value,
+            detail=job.detail,
+            created_at=job.created_at,
+            finished_at=job.finished_at
+        )
+
 class SearchRequest(BaseModel):
     query: str = Field(..., min_length=1)
     k: int = Field(..., ge=1)
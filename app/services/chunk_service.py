@@ -1,8 +1,9 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 from uuid import UUID
 from app.repositories.base import BaseRepository
 from app.domain.models import ChunkModel, DocumentModel
 from app.services.index_service import IndexService
+from app.indexes.base import BaseIndex
 from app.utils.embedding import CohereEmbedding
 from app.exceptions import NotFoundError, ValidationError, IndexError, EmbeddingError
 from uuid import uuid4
@@ -29,53 +30,111 @@ class ChunkService:
         return chunk
     
     def create(self, library_id: UUID, text: str, metadata: dict, 
-               document_id: Optional[UUID] = None, document_metadata: dict = {}) -> ChunkModel:
+               document_id: Optional[UUID] = None, document_metadata: dict = {},
+               embedding: Optional[List[float]] = None) -> ChunkModel:
         if not self._library_repository.exists(library_id):
             raise NotFoundError(f"Library with id {library_id} does not exist.")
         
+        chunk = self._store_chunk(library_id, text, metadata, document_id, document_metadata, embedding)
+        index = self._index_service.get_index(library_id)
+        if not index:
+            raise IndexError(f"No index found for library {library_id}")
+        
+        self._add_to_index(index, chunk)
+        
+        return chunk.model_copy(deep=True)
+    
+    def create_many(self, library_id: UUID, items: List[Dict[str, Any]], defer_index: bool = False) -> List[ChunkModel]:
+        """
+        Create several chunks in one call. Each item takes the keyword arguments of create().
+        With defer_index, chunks are only added to the index on the next index build.
+        """
+        if not self._library_repository.exists(library_id):
+            raise NotFoundError(f"Library with id {library_id} does not exist.")
+        
+        index = self._index_service.get_index(library_id)
+        if not index:
+            raise IndexError(f"No index found for library {library_id}")
+        
+        # Validate and embed every item before saving any, so a bad item leaves nothing behind
+        prepared = [self._prepare_chunk(library_id, **item) for item in items]
+        for chunk, new_document in prepared:
+            self._save_chunk(chunk, new_document)
+        chunks = [chunk for chunk, _ in prepared]
+        
+        if defer_index:
+            self._index_service.defer_chunks(library_id, [chunk.id for chunk in chunks])
+        else:
+            for chunk in chunks:
+                self._add_to_index(index, chunk)
+        
+        return [chunk.model_copy(deep=True) for chunk in chunks]
+    
+    def _store_chunk(self, library_id: UUID, text: str, metadata: dict, 
+                     document_id: Optional[UUID] = None, document_metadata: dict = {},
+                     embedding: Optional[List[float]] = None) -> ChunkModel:
+        chunk, new_document = self._prepare_chunk(library_id, text, metadata, document_id, document_metadata, embedding)
+        self._save_chunk(chunk, new_document)
+        return chunk
+    
+    def _prepare_chunk(self, library_id: UUID, text: str, metadata: dict, 
+                       document_id: Optional[UUID] = None, document_metadata: dict = {},
+                       embedding: Optional[List[float]] = None) -> Tuple[ChunkModel, Optional[DocumentModel]]:
+        """Validate and build a chunk (plus its auto-created document, if any) without saving anything."""
+        new_document = None
         if document_id is None:
-            document = DocumentModel(
+            new_document = DocumentModel(
                 library_id=library_id,
                 metadata=document_metadata
             )
-            self._document_repository.save(document)
-            self._library_repository.add_document_to_library(library_id, document.id)
+            document_id = new_document.id
         
         else:
             document = self._document_repository.get_by_id(document_id)
             if not document or document.library_id != library_id:
                 raise NotFoundError(f"Document with id {document_id} not found in library {library_id}")
         
-        try:
-            embedding = self._embedding_service.embed(text)
-        except Exception as e:
-            raise EmbeddingError(f"Error generating embedding: {e}")
+        if embedding is None:
+            try:
+                embedding = self._embedding_service.embed(text)
+            except Exception as e:
+                raise EmbeddingError(f"Error generating embedding: {e}")
+        elif len(embedding) != self._embedding_service.dimension:
+            # A mismatched vector would break search for the whole library
+            raise ValidationError(
+                f"Embedding has dimension {len(embedding)}, expected {self._embedding_service.dimension}"
+            )
+        elif not any(embedding):
+            # Cosine similarity is undefined for a zero vector
+            raise ValidationError("Embedding must not be the zero vector")
         
         chunk = ChunkModel(
             library_id=library_id,
-            document_id=document.id,
+            document_id=document_id,
             text=text,
             embedding=embedding,
             metadata=metadata
         )
+        return chunk, new_document
+    
+    def _save_chunk(self, chunk: ChunkModel, new_document: Optional[DocumentModel]) -> None:
+        if new_document is not None:
+            self._document_repository.save(new_document)
+            self._library_repository.add_document_to_library(chunk.library_id, new_document.id)
         
         self._chunk_repository.save(chunk)
-        self._document_repository.add_chunk_to_document(document.id, chunk.id)
-        index = self._index_service.get_index(library_id)
-        if not index:
-            raise IndexError(f"No index found for library {library_id}")
-        
+        self._document_repository.add_chunk_to_document(chunk.document_id, chunk.id)
+    
+    def _add_to_index(self, index: BaseIndex, chunk: ChunkModel) -> None:
         index.add(
             chunk_id=chunk.id,
-            embedding=embedding,
+            embedding=chunk.embedding,
             metadata={
-                "document_id": document.id,
-                "library_id": library_id,
-                **metadata
+                "document_id": chunk.document_id,
+                "library_id": chunk.library_id,
+                **chunk.metadata
             }
         )
-        
-        return chunk.model_copy(deep=True)
     
     def update(self, chunk_id: UUID, library_id: UUID, text: Optional[str] = None, 
                metadata: Optional[dict] = None, document_id: Optional[UUID] = None) -> ChunkModel:
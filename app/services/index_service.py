@@ -1,17 +1,22 @@
 from typing import Dict, Optional, Any, List, Tuple
 from uuid import UUID
+from datetime import datetime, timezone
 from app.indexes.base import BaseIndex
 from app.indexes.factory import create_index
-from app.exceptions import AlreadyExistsError, IndexError
+from app.exceptions import AlreadyExistsError, IndexError, NotFoundError
 from app.indexes.implementations.ivf import IVFIndex
 from app.utils.embedding import CohereEmbedding
-from app.domain.models import ChunkModel
+from app.domain.models import ChunkModel, IndexBuildJobModel, IndexBuildStatus
 from app.repositories.base import BaseRepository
 
 class IndexService:
     
     def __init__(self, chunk_repository: BaseRepository, embedding_service: CohereEmbedding):
         self._active_indexes: Dict[UUID, BaseIndex] = {}
+        # Chunks stored but not yet added to their library's index (flushed on build)
+        self._deferred_chunks: Dict[UUID, List[UUID]] = {}
+        # Latest background build job per library
+        self._build_jobs: Dict[UUID, IndexBuildJobModel] = {}
         self._embedding_service = embedding_service
         self._chunk_repository = chunk_repository
     
@@ -28,16 +33,78 @@ class IndexService:
     def delete_index_for_library(self, library_id: UUID) -> None:
         if library_id in self._active_indexes:
             del self._active_indexes[library_id]
+        self._deferred_chunks.pop(library_id, None)
+        self._build_jobs.pop(library_id, None)
+
+    def reset(self) -> None:
+        """Drop every index, deferred chunk and build job."""
+        self._active_indexes.clear()
+        self._deferred_chunks.clear()
+        self._build_jobs.clear()
+
+    def defer_chunks(self, library_id: UUID, chunk_ids: List[UUID]) -> None:
+        self._deferred_chunks.setdefault(library_id, []).extend(chunk_ids)
     
     def build_index(self, library_id: UUID) -> None:
         index = self.get_index(library_id)
         if not index:
             raise IndexError(f"No index found for library {library_id}")
 
+        self._flush_deferred_chunks(library_id, index)
+
         success = index.index()
         if not success:
             raise IndexError(f"Failed to build index for library {library_id}")
 
+    def start_build_job(self, library_id: UUID) -> IndexBuildJobModel:
+        """Register a background build; the caller schedules run_build_job with the returned job id."""
+        if not self.get_index(library_id):
+            raise IndexError(f"No index found for library {library_id}")
+
+        job = IndexBuildJobModel(library_id=library_id)
+        self._build_jobs[library_id] = job
+        return job.model_copy()
+
+    def run_build_job(self, library_id: UUID, job_id: UUID) -> None:
+        job = self._build_jobs.get(library_id)
+        if not job or job.id != job_id:
+            # Superseded by a newer job (or the library was deleted)
+            return
+
+        job.status = IndexBuildStatus.BUILDING
+        try:
+            self.build_index(library_id)
+            job.status = IndexBuildStatus.READY
+        except Exception as e:
+            job.status = IndexBuildStatus.FAILED
+            job.detail = str(e)
+        job.finished_at = datetime.now(timezone.utc)
+
+    def get_build_job(self, library_id: UUID) -> IndexBuildJobModel:
+        if not self.get_index(library_id):
+            raise IndexError(f"No index found for library {library_id}")
+
+        job = self._build_jobs.get(library_id)
+        if not job:
+            raise NotFoundError(f"No index build job found for library {library_id}")
+        return job.model_copy()
+
+    def _flush_deferred_chunks(self, library_id: UUID, index: BaseIndex) -> None:
+        # Read chunks back from the repository so deletes/updates made since deferral are honored
+        for chunk_id in self._deferred_chunks.pop(library_id, []):
+            chunk = self._chunk_repository.get_by_id(chunk_id)
+            if not chunk:
+                continue
+            index.add(
+                chunk_id=chunk.id,
+                embedding=chunk.embedding,
+                metadata={
+                    "document_id": chunk.document_id,
+                    "library_id": library_id,
+                    **chunk.metadata
+                }
+            )
+
     def search(self, library_id: UUID, query_text: str, k: int,
                filters: Optional[Dict[str, Any]] = None) -> List[Tuple[ChunkModel, float]]:
         index = self.get_index(library_id)
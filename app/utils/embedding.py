@@ -9,6 +9,8 @@ load_dotenv(override=True)
 # Valid dimensions for embed-v4 and newer models
 VALID_DIMENSIONS = [256, 512, 1024, 1536]
 DEFAULT_DIMENSION = 1536
+# Maximum number of texts Cohere accepts in a single embed request
+MAX_BATCH_SIZE = 96
 
 class CohereEmbedding:
     """
@@ -18,15 +20,27 @@ class CohereEmbedding:
     Only available for embed-v4 and newer models.
     """
     
-    def __init__(self, model: str = "embed-v4.0"):
+    def __init__(self, model: str = "embed-v4.0", api_key: Optional[str] = None):
         self.model = model
-        self.co = cohere.ClientV2()
+        # Falls back to the same environment variables the Cohere SDK reads
+        self._api_key = api_key or os.getenv("CO_API_KEY", os.getenv("COHERE_API_KEY"))
+        # The SDK calls the token provider per request, so set_api_key() takes effect
+        # without rebuilding the client (and its warm connection pool)
+        self.co = cohere.ClientV2(api_key=(lambda: self._api_key) if self._api_key else None)
         self.valid_dimensions = [256, 512, 1024, 1536]
+        # Dimension embed() produces by default; precomputed embeddings must match it
+        self.dimension = 1024
+
+    def set_api_key(self, api_key: str) -> None:
+        """Rotate the API key used for subsequent requests."""
+        self._api_key = api_key
     
-    def embed(self, text: str, input_type: Literal["search_document", "search_query"] = "search_document", dimension: int = 1024) -> List[float]:
+    def embed(self, text: str, input_type: Literal["search_document", "search_query"] = "search_document", dimension: Optional[int] = None) -> List[float]:
         if not text.strip():
             raise ValueError("Text cannot be empty")
         
+        dimension = dimension or self.dimension
+        
         if dimension not in self.valid_dimensions:
             raise ValueError(f"Invalid dimension {dimension}. Valid dimensions are: {self.valid_dimensions}")
         
@@ -41,4 +55,34 @@ class CohereEmbedding:
             return response.embeddings.float_[0]
             
         except Exception as e:
-            raise Exception(f"Failed to generate embedding: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Failed to generate embedding: {str(e)}")
+
+    def embed_batch(self, texts: List[str], input_type: Literal["search_document", "search_query"] = "search_document", dimension: Optional[int] = None) -> List[List[float]]:
+        """
+        Embed up to MAX_BATCH_SIZE texts in a single request.
+        Returned embeddings are in the same order as the input texts.
+        Cohere SDK errors (e.g. cohere.TooManyRequestsError) propagate unchanged
+        so callers can decide which ones to retry.
+        """
+        if not texts:
+            return []
+
+        if len(texts) > MAX_BATCH_SIZE:
+            raise ValueError(f"Cannot embed more than {MAX_BATCH_SIZE} texts per request, got {len(texts)}")
+
+        if any(not text.strip() for text in texts):
+            raise ValueError("Text cannot be empty")
+
+        dimension = dimension or self.dimension
+
+        if dimension not in self.valid_dimensions:
+            raise ValueError(f"Invalid dimension {dimension}. Valid dimensions are: {self.valid_dimensions}")
+
+        response = self.co.embed(
+            model=self.model,
+            texts=texts,
+            input_type=input_type,
+            embedding_types=["float"],
+            output_dimension=dimension
+        )
+        return response.embeddings.float_
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 
 import numpy as np
 
@@ -12,9 +12,14 @@ class KMeans:
     - Uses cosine distance (1 - cosine similarity) for assignment
     - Recomputes centroids as arithmetic mean of assigned points
     - Random initialization by sampling k unique points
+    - Empty clusters are reseeded with the points farthest from their centroid
     """
 
-    def __init__(self, n_clusters: int, max_iters: Optional[int] = None, tol: Optional[float] = None):
+    def __init__(self,
+                 n_clusters: int,
+                 max_iters: Optional[int] = None,
+                 tol: Optional[float] = None,
+                 float32_sims: Optional[bool] = None):
         if n_clusters <= 0:
             raise ValueError("n_clusters must be positive")
 
@@ -25,7 +30,12 @@ class KMeans:
         self.max_iters = max_iters if max_iters is not None else config["max_iters"]
         self.tol = tol if tol is not None else config["tolerance"]
 
-        self.centroids: List[List[float]] = []
+        # Halves the memory and bandwidth of the assignment step; near-ties may resolve differently
+        self.float32_sims = float32_sims if float32_sims is not None else config["float32_sims"]
+
+        self.centroids: Union[List[List[float]], np.ndarray] = []
+        # Normalized centroids cached at fit time so predict() skips re-normalizing
+        self._centroids_n: Optional[np.ndarray] = None
 
     def _normalize(self, X: np.ndarray) -> np.ndarray:
         if X.size == 0:
@@ -34,13 +44,19 @@ class KMeans:
         norms[norms == 0.0] = 1.0
         return X / norms
 
-    def fit(self, X: List[List[float]]) -> Tuple[List[List[float]], List[int]]:
+    def fit(self, X: List[List[float]], return_arrays: bool = False) -> Tuple[Union[List[List[float]], np.ndarray], Union[List[int], np.ndarray]]:
         """
         Fit K-Means on the dataset.
 
         Returns (centroids, labels) where labels are indices in [0, k-1].
+        With return_arrays=True both are returned as ndarrays, skipping the
+        conversion to Python lists.
         """
-        if not X:
+        if len(X) == 0:
+            self._centroids_n = None
+            if return_arrays:
+                self.centroids = np.empty((0, 0))
+                return self.centroids, np.empty(0, dtype=int)
             self.centroids = []
             return [], []
 
@@ -54,41 +70,61 @@ class KMeans:
 
         labels = np.zeros(n_samples, dtype=int)
 
+        # Data never moves, so normalize it once; the remaining buffers are k-sized
+        # (plus sims) and reused, so no iteration allocates another copy of the data
+        sims_dtype = np.float32 if self.float32_sims else np.float64
+        data_n = self._normalize(data).astype(sims_dtype, copy=False)
+        sims = np.empty((n_samples, k), dtype=sims_dtype)
+        sums = np.empty_like(centroids)
+        new_centroids = np.empty_like(centroids)
+        diff = np.empty_like(centroids)
+
         for _ in range(self.max_iters):
             # Assignment step via cosine similarity (argmax similarity == argmin distance)
-            data_n = self._normalize(data)
-            centroids_n = self._normalize(centroids)
-            sims = data_n @ centroids_n.T
+            centroids_n = self._normalize(centroids).astype(sims_dtype, copy=False)
+            np.matmul(data_n, centroids_n.T, out=sims)
             labels = np.argmax(sims, axis=1)
 
             # Update step
-            new_centroids = centroids.copy()
-            max_shift = 0.0
-            for ci in range(k):
-                members = data[labels == ci]
-                if members.size > 0:
-                    candidate = members.mean(axis=0)
-                    shift = float(np.linalg.norm(candidate - centroids[ci]))
-                    if shift > max_shift:
-                        max_shift = shift
-                    new_centroids[ci] = candidate
-
-            centroids = new_centroids
+            # Scatter-add each point into its cluster's row; no sorted copy of the data
+            counts = np.bincount(labels, minlength=k)
+            sums.fill(0.0)
+            np.add.at(sums, labels, data)
+
+            np.copyto(new_centroids, centroids)
+            nonempty = counts > 0
+            np.divide(sums, counts[:, None], out=new_centroids, where=nonempty[:, None])
+
+            # Reseed empty clusters with the points farthest from their assigned centroid
+            empty = np.flatnonzero(~nonempty)
+            if empty.size > 0:
+                d_assigned = 1.0 - sims[np.arange(n_samples), labels]
+                farthest = np.argpartition(-d_assigned, empty.size - 1)[:empty.size]
+                new_centroids[empty] = data[farthest]
+
+            np.subtract(new_centroids, centroids, out=diff)
+            max_shift = float(np.linalg.norm(diff, axis=1).max())
+
+            centroids, new_centroids = new_centroids, centroids
             if max_shift <= self.tol:
                 break
 
+        self._centroids_n = self._normalize(centroids)
+        if return_arrays:
+            self.centroids = centroids
+            return centroids, labels
+
         self.centroids = centroids.tolist()
         return self.centroids, labels.tolist()
 
     def predict(self, X: List[List[float]]) -> List[int]:
-        if not self.centroids:
+        if len(self.centroids) == 0:
             return [0 for _ in X]
-        if not X:
+        if len(X) == 0:
             return []
-        data = np.asarray(X, dtype=float)
-        centroids = np.asarray(self.centroids, dtype=float)
-        data_n = self._normalize(data)
-        centroids_n = self._normalize(centroids)
-        sims = data_n @ centroids_n.T
+        if self._centroids_n is None:
+            self._centroids_n = self._normalize(np.asarray(self.centroids, dtype=float))
+        data_n = self._normalize(np.asarray(X, dtype=float))
+        sims = data_n @ self._centroids_n.T
         labels = np.argmax(sims, axis=1)
         return labels.tolist()
\ No newline at end of file
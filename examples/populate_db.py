@@ -15,449 +15,459 @@ Creates three libraries with different indexing strategies:
 
 import asyncio
 import httpx
+import orjson
 from datetime import datetime, date
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 import json
 import sys
 import os
 import time
+import hashlib
+import gzip
+import shelve
+import random
 
-# Add the app directory to the path to import modules
-sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
+try:
+    # Optional: libuv-based event loop with a cheaper socket path for many in-flight requests
+    import uvloop
+except ImportError:
+    uvloop = None
 
-from app.utils.embedding import CohereEmbedding
+from app.utils.embedding import CohereEmbedding, MAX_BATCH_SIZE
+from app.schemas.chunk_schemas import ChunkCreateRequest
+from pydantic import ValidationError
+from cohere.errors import TooManyRequestsError, ServiceUnavailableError, GatewayTimeoutError
 
 # Configuration
 BASE_URL = "http://localhost:8000/v1"
+# Health is served at the root, outside the versioned API prefix (never /v1/health)
+HEALTH_URL = BASE_URL.rsplit("/v1", 1)[0] + "/health"
+# Fail fast if the API is down or hung instead of waiting out the default timeout
+HEALTH_CHECK_TIMEOUT = httpx.Timeout(2.0, connect=1.0)
+# Retry the health check while the API is still starting (backoff 0.5s, 1s, 2s, 4s)
+HEALTH_CHECK_ATTEMPTS = 5
+HEALTH_CHECK_BACKOFF = 0.5
+# Maximum number of chunk POSTs in flight at once
+MAX_CONCURRENT_REQUESTS = 16
+# Chunks per bulk-create request
+BATCH_SIZE = 32
+# Bulk bodies larger than this are gzip-compressed (level 1: cheap CPU, most of the size win)
+GZIP_MIN_BYTES = 1024
+# Bulk uploads in flight across all libraries; more than ~2 stops helping and starts to hurt
+MAX_CONCURRENT_UPLOADS = 2
+# Embedding settings for chunk documents (must match the server's query embeddings)
+EMBED_INPUT_TYPE = "search_document"
+EMBED_DIMENSION = 1024
+# On-disk embedding cache so re-runs skip the Cohere API for unchanged texts
+EMBED_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".embed_cache")
 # Set your Cohere API keys here or in environment variables
 COHERE_API_KEYS = [
     "pa6sRhnVAedMVClPAwoCvC1MjHKEwjtcGSTjWRMd",
     "rQsWxQJOK89Gp87QHo6qnGtPiWerGJOxvdg59o5f"
 ]
 
+# Summary printed after a successful run (sample queries to compare the three indexes)
+_HELP_BANNER = """
+============================================================
+🎉 Successfully populated Vector DB!
+
+Created Libraries:
+{libraries}
+
+Total chunks created: {total_chunks}
+
+🔍 Performance Comparison Queries:
+(Test the same queries across all three index types)
+
+🎌 Anime Queries:
+  • 'psychological thriller anime' (should find Death Note chunks)
+  • 'giant creatures titans' (should find Attack on Titan chunks)
+  • 'demon slayer sword fighting' (should find Demon Slayer chunks)
+  • 'pirate adventure treasure' (should find One Piece chunks)
+
+🍎 Apple Product Queries:
+  • 'titanium smartphone camera' (should find iPhone 15 Pro chunks)
+  • 'M2 chip laptop display' (should find MacBook Air chunks)
+  • 'wireless earbuds noise cancellation' (should find AirPods chunks)
+
+🤖 AI Technology Queries:
+  • 'conversational AI chatbot' (should find ChatGPT chunks)
+  • 'Constitutional AI safety' (should find Claude chunks)
+  • 'image generation art' (should find DALL-E chunks)
+  • 'code completion programming' (should find GitHub Copilot chunks)
+
+📊 Performance Testing Tips:
+  • Test search speed across Linear vs IVF vs NSW
+  • Compare result quality and ranking
+  • Try k=1, k=5, k=10 for different result counts
+  • Use metadata filters to test combined filtering + search
+
+🔧 Metadata Filtering Examples:
+  • Filter by release_date > '2022-01-01'
+  • Filter by product_type = 'smartphone'
+  • Filter by company = 'OpenAI'
+  • Filter by chunk_type = 'overview'
+"""
+
+def _expand(items: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield {text, metadata} chunk rows, merging each item's shared base metadata into its chunks"""
+    for item in items:
+        for chunk in item["chunks"]:
+            yield {
+                "text": chunk["text"],
+                "metadata": {**item["base"], **{key: value for key, value in chunk.items() if key != "text"}}
+            }
+
 class VectorDBPopulator:
-    def __init__(self, base_url: str = BASE_URL):
-        self.base_url = base_url
-        self.client = httpx.AsyncClient()
+    def __init__(self, base_url: str = BASE_URL, health_url: str = HEALTH_URL):
+        # One pooled client for every request; keep-alive avoids a new connection per POST
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            # Sized for MAX_CONCURRENT_REQUESTS in-flight POSTs with headroom; idle connections stay warm for 30s
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        self.health_url = health_url
         self.current_key_index = 0
-        self.embedder = None
-        self._init_embedder()
+        self.embedder = CohereEmbedding(api_key=COHERE_API_KEYS[self.current_key_index])
         
+        # Shared by every library's bulk uploads so the total stays bounded
+        self._upload_sem = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
         # Store created library IDs for reference
         self.library_ids = {}
-        
-    def _init_embedder(self):
-        """Initialize embedder with current API key"""
-        os.environ["COHERE_API_KEY"] = COHERE_API_KEYS[self.current_key_index]
-        self.embedder = CohereEmbedding()
+        self._library_items: Tuple[Tuple[str, str], ...] = ()
+        # Number of chunks in the dataset, set by get_test_data
+        self._total_chunks = 0
+
+        # Embeddings keyed by text; libraries share the same dataset so repeats are common
+        self._embed_cache: Dict[str, List[float]] = {}
+        self._disk_cache = shelve.open(EMBED_CACHE_PATH)
         
     def _switch_api_key(self):
         """Switch to next API key if available"""
         if self.current_key_index < len(COHERE_API_KEYS) - 1:
             self.current_key_index += 1
             print(f"Switching to API key {self.current_key_index + 1}")
-            self._init_embedder()
+            self.embedder.set_api_key(COHERE_API_KEYS[self.current_key_index])
             return True
         return False
         
     async def close(self):
-        """Close the HTTP client"""
+        """Close the HTTP client and the embedding disk cache"""
         await self.client.aclose()
+        self._disk_cache.close()
+
+    def _disk_cache_key(self, text: str) -> str:
+        return hashlib.sha256(f"{text}|{self.embedder.model}|{EMBED_INPUT_TYPE}|{EMBED_DIMENSION}".encode()).hexdigest()
+
+    async def _post_json(self, path: str, payload: Dict[str, Any], compress: bool = False) -> httpx.Response:
+        """POST a JSON body serialized with orjson (much faster than httpx's stdlib json)"""
+        body = orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+        headers = {"content-type": "application/json"}
+        if compress and len(body) > GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers["content-encoding"] = "gzip"
+        return await self.client.post(path, content=body, headers=headers)
 
     def get_test_data(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Returns structured test data for three topics with rich metadata.
         Multiple chunks about the same items for better testing.
+
+        Each item holds the metadata shared by its chunks under "base" and the
+        per-chunk fields under "chunks"; use _expand() to get {text, metadata} rows.
         """
-        return {
+        test_data = {
             "anime": [
                 # Death Note chunks (3 chunks)
                 {
-                    "text": "Death Note is a psychological thriller anime about Light Yagami, a brilliant student who discovers a supernatural notebook.",
-                    "metadata": {
-                        "anime_name": "Death Note",
-                        "release_date": "2006-10-04",
-                        "genre": "Psychological Thriller",
-                        "studio": "Madhouse",
-                        "rating": 9.0,
-                        "episodes": 37,
-                        "status": "completed",
-                        "chunk_type": "overview"
-                    }
-                },
-                {
-                    "text": "The Death Note grants its user the power to kill anyone by writing their name in the notebook while picturing their face.",
-                    "metadata": {
-                        "anime_name": "Death Note",
-                        "release_date": "2006-10-04",
-                        "genre": "Psychological Thriller",
-                        "studio": "Madhouse",
-                        "rating": 9.0,
-                        "episodes": 37,
-                        "status": "completed",
-                        "chunk_type": "plot_mechanism"
-                    }
-                },
-                {
-                    "text": "Light Yagami uses the Death Note to eliminate criminals, believing he can create a perfect world, while L tries to catch him.",
-                    "metadata": {
+                    "base": {
                         "anime_name": "Death Note",
                         "release_date": "2006-10-04",
                         "genre": "Psychological Thriller",
                         "studio": "Madhouse",
                         "rating": 9.0,
                         "episodes": 37,
-                        "status": "completed",
-                        "chunk_type": "character_conflict"
-                    }
+                        "status": "completed"
+                    },
+                    "chunks": [
+                        {
+                            "text": "Death Note is a psychological thriller anime about Light Yagami, a brilliant student who discovers a supernatural notebook.",
+                            "chunk_type": "overview"
+                        },
+                        {
+                            "text": "The Death Note grants its user the power to kill anyone by writing their name in the notebook while picturing their face.",
+                            "chunk_type": "plot_mechanism"
+                        },
+                        {
+                            "text": "Light Yagami uses the Death Note to eliminate criminals, believing he can create a perfect world, while L tries to catch him.",
+                            "chunk_type": "character_conflict"
+                        }
+                    ]
                 },
                 # Attack on Titan chunks (2 chunks)
                 {
-                    "text": "Attack on Titan depicts humanity's struggle for survival against giant humanoid creatures called Titans behind massive walls.",
-                    "metadata": {
+                    "base": {
                         "anime_name": "Attack on Titan",
                         "release_date": "2013-04-07",
                         "genre": "Dark Fantasy",
                         "studio": "Studio Pierrot",
                         "rating": 9.1,
                         "episodes": 87,
-                        "status": "completed",
-                        "chunk_type": "world_setting"
-                    }
-                },
-                {
-                    "text": "Eren Yeager joins the Survey Corps to fight Titans after witnessing his mother's death during the fall of Wall Maria.",
-                    "metadata": {
-                        "anime_name": "Attack on Titan",
-                        "release_date": "2013-04-07",
-                        "genre": "Dark Fantasy",
-                        "studio": "Studio Pierrot",
-                        "rating": 9.1,
-                        "episodes": 87,
-                        "status": "completed",
-                        "chunk_type": "protagonist_motivation"
-                    }
+                        "status": "completed"
+                    },
+                    "chunks": [
+                        {
+                            "text": "Attack on Titan depicts humanity's struggle for survival against giant humanoid creatures called Titans behind massive walls.",
+                            "chunk_type": "world_setting"
+                        },
+                        {
+                            "text": "Eren Yeager joins the Survey Corps to fight Titans after witnessing his mother's death during the fall of Wall Maria.",
+                            "chunk_type": "protagonist_motivation"
+                        }
+                    ]
                 },
                 # Demon Slayer chunks (2 chunks)
                 {
-                    "text": "Demon Slayer follows Tanjiro Kamado who becomes a demon slayer to find a cure for his sister Nezuko who turned into a demon.",
-                    "metadata": {
-                        "anime_name": "Demon Slayer",
-                        "release_date": "2019-04-06",
-                        "genre": "Supernatural",
-                        "studio": "Ufotable",
-                        "rating": 8.7,
-                        "episodes": 44,
-                        "status": "ongoing",
-                        "chunk_type": "main_plot"
-                    }
-                },
-                {
-                    "text": "The Demon Slayer Corps uses special breathing techniques and Nichirin swords to fight demons that prey on humans.",
-                    "metadata": {
+                    "base": {
                         "anime_name": "Demon Slayer",
                         "release_date": "2019-04-06",
                         "genre": "Supernatural",
                         "studio": "Ufotable",
                         "rating": 8.7,
                         "episodes": 44,
-                        "status": "ongoing",
-                        "chunk_type": "combat_system"
-                    }
+                        "status": "ongoing"
+                    },
+                    "chunks": [
+                        {
+                            "text": "Demon Slayer follows Tanjiro Kamado who becomes a demon slayer to find a cure for his sister Nezuko who turned into a demon.",
+                            "chunk_type": "main_plot"
+                        },
+                        {
+                            "text": "The Demon Slayer Corps uses special breathing techniques and Nichirin swords to fight demons that prey on humans.",
+                            "chunk_type": "combat_system"
+                        }
+                    ]
                 },
                 # One Piece chunks (3 chunks)
                 {
-                    "text": "One Piece follows Monkey D. Luffy's quest to become the Pirate King and find the legendary treasure called One Piece.",
-                    "metadata": {
+                    "base": {
                         "anime_name": "One Piece",
                         "release_date": "1999-10-20",
                         "genre": "Adventure",
                         "studio": "Toei Animation",
                         "rating": 9.2,
                         "episodes": 1000,
-                        "status": "ongoing",
-                        "chunk_type": "main_quest"
-                    }
-                },
-                {
-                    "text": "Luffy has rubber powers from eating the Gomu Gomu no Mi Devil Fruit and assembles a diverse crew called the Straw Hat Pirates.",
-                    "metadata": {
-                        "anime_name": "One Piece",
-                        "release_date": "1999-10-20",
-                        "genre": "Adventure",
-                        "studio": "Toei Animation",
-                        "rating": 9.2,
-                        "episodes": 1000,
-                        "status": "ongoing",
-                        "chunk_type": "protagonist_abilities"
-                    }
-                },
-                {
-                    "text": "The Grand Line is a dangerous sea route where pirates search for treasure while facing the World Government and other pirates.",
-                    "metadata": {
-                        "anime_name": "One Piece",
-                        "release_date": "1999-10-20",
-                        "genre": "Adventure",
-                        "studio": "Toei Animation",
-                        "rating": 9.2,
-                        "episodes": 1000,
-                        "status": "ongoing",
-                        "chunk_type": "world_geography"
-                    }
+                        "status": "ongoing"
+                    },
+                    "chunks": [
+                        {
+                            "text": "One Piece follows Monkey D. Luffy's quest to become the Pirate King and find the legendary treasure called One Piece.",
+                            "chunk_type": "main_quest"
+                        },
+                        {
+                            "text": "Luffy has rubber powers from eating the Gomu Gomu no Mi Devil Fruit and assembles a diverse crew called the Straw Hat Pirates.",
+                            "chunk_type": "protagonist_abilities"
+                        },
+                        {
+                            "text": "The Grand Line is a dangerous sea route where pirates search for treasure while facing the World Government and other pirates.",
+                            "chunk_type": "world_geography"
+                        }
+                    ]
                 }
             ],
             "apple": [
                 # iPhone chunks (4 chunks)
                 {
-                    "text": "iPhone 15 Pro features a titanium design with the powerful A17 Pro chip for enhanced performance and efficiency.",
-                    "metadata": {
-                        "product_name": "iPhone 15 Pro",
-                        "product_type": "smartphone",
-                        "release_date": "2023-09-22",
-                        "price_range": "premium",
-                        "chip": "A17 Pro",
-                        "material": "titanium",
-                        "chunk_type": "design_performance"
-                    }
-                },
-                {
-                    "text": "The iPhone 15 Pro camera system includes a 48MP main camera, ultra-wide, and telephoto lenses with advanced computational photography.",
-                    "metadata": {
+                    "base": {
                         "product_name": "iPhone 15 Pro",
                         "product_type": "smartphone",
                         "release_date": "2023-09-22",
                         "price_range": "premium",
                         "chip": "A17 Pro",
-                        "material": "titanium",
-                        "chunk_type": "camera_features"
-                    }
-                },
-                {
-                    "text": "iPhone 15 Pro supports USB-C connectivity and offers storage options from 128GB to 1TB with ProRAW and ProRes capabilities.",
-                    "metadata": {
-                        "product_name": "iPhone 15 Pro",
-                        "product_type": "smartphone",
-                        "release_date": "2023-09-22",
-                        "price_range": "premium",
-                        "chip": "A17 Pro",
-                        "material": "titanium",
-                        "chunk_type": "connectivity_storage"
-                    }
-                },
-                {
-                    "text": "The iPhone 15 Pro Action Button replaces the mute switch and can be customized for various functions and shortcuts.",
-                    "metadata": {
-                        "product_name": "iPhone 15 Pro",
-                        "product_type": "smartphone",
-                        "release_date": "2023-09-22",
-                        "price_range": "premium",
-                        "chip": "A17 Pro",
-                        "material": "titanium",
-                        "chunk_type": "user_interface"
-                    }
+                        "material": "titanium"
+                    },
+                    "chunks": [
+                        {
+                            "text": "iPhone 15 Pro features a titanium design with the powerful A17 Pro chip for enhanced performance and efficiency.",
+                            "chunk_type": "design_performance"
+                        },
+                        {
+                            "text": "The iPhone 15 Pro camera system includes a 48MP main camera, ultra-wide, and telephoto lenses with advanced computational photography.",
+                            "chunk_type": "camera_features"
+                        },
+                        {
+                            "text": "iPhone 15 Pro supports USB-C connectivity and offers storage options from 128GB to 1TB with ProRAW and ProRes capabilities.",
+                            "chunk_type": "connectivity_storage"
+                        },
+                        {
+                            "text": "The iPhone 15 Pro Action Button replaces the mute switch and can be customized for various functions and shortcuts.",
+                            "chunk_type": "user_interface"
+                        }
+                    ]
                 },
                 # MacBook Air chunks (3 chunks)
                 {
-                    "text": "MacBook Air M2 delivers exceptional performance with the Apple M2 chip in an incredibly thin and lightweight design.",
-                    "metadata": {
+                    "base": {
                         "product_name": "MacBook Air M2",
                         "product_type": "laptop",
                         "release_date": "2022-07-15",
                         "price_range": "mid-range",
                         "chip": "M2",
-                        "form_factor": "ultrabook",
-                        "chunk_type": "performance_design"
-                    }
-                },
-                {
-                    "text": "The MacBook Air M2 features a 13.6-inch Liquid Retina display with 500 nits brightness and P3 wide color gamut.",
-                    "metadata": {
-                        "product_name": "MacBook Air M2",
-                        "product_type": "laptop",
-                        "release_date": "2022-07-15",
-                        "price_range": "mid-range",
-                        "chip": "M2",
-                        "form_factor": "ultrabook",
-                        "chunk_type": "display_specs"
-                    }
-                },
-                {
-                    "text": "MacBook Air M2 offers up to 18 hours of battery life and comes in Midnight, Starlight, Space Gray, and Silver colors.",
-                    "metadata": {
-                        "product_name": "MacBook Air M2",
-                        "product_type": "laptop",
-                        "release_date": "2022-07-15",
-                        "price_range": "mid-range",
-                        "chip": "M2",
-                        "form_factor": "ultrabook",
-                        "chunk_type": "battery_options"
-                    }
+                        "form_factor": "ultrabook"
+                    },
+                    "chunks": [
+                        {
+                            "text": "MacBook Air M2 delivers exceptional performance with the Apple M2 chip in an incredibly thin and lightweight design.",
+                            "chunk_type": "performance_design"
+                        },
+                        {
+                            "text": "The MacBook Air M2 features a 13.6-inch Liquid Retina display with 500 nits brightness and P3 wide color gamut.",
+                            "chunk_type": "display_specs"
+                        },
+                        {
+                            "text": "MacBook Air M2 offers up to 18 hours of battery life and comes in Midnight, Starlight, Space Gray, and Silver colors.",
+                            "chunk_type": "battery_options"
+                        }
+                    ]
                 },
                 # AirPods chunks (3 chunks)
                 {
-                    "text": "AirPods Pro 2nd generation feature the H2 chip for enhanced Active Noise Cancellation and superior audio quality.",
-                    "metadata": {
-                        "product_name": "AirPods Pro 2nd Gen",
-                        "product_type": "earbuds",
-                        "release_date": "2022-09-23",
-                        "price_range": "premium",
-                        "chip": "H2",
-                        "form_factor": "wireless earbuds",
-                        "chunk_type": "audio_technology"
-                    }
-                },
-                {
-                    "text": "The AirPods Pro case supports MagSafe charging and includes a built-in speaker for Find My location tracking.",
-                    "metadata": {
-                        "product_name": "AirPods Pro 2nd Gen",
-                        "product_type": "earbuds",
-                        "release_date": "2022-09-23",
-                        "price_range": "premium",
-                        "chip": "H2",
-                        "form_factor": "wireless earbuds",
-                        "chunk_type": "charging_features"
-                    }
-                },
-                {
-                    "text": "AirPods Pro offer Spatial Audio with dynamic head tracking and up to 6 hours of listening time with ANC enabled.",
-                    "metadata": {
+                    "base": {
                         "product_name": "AirPods Pro 2nd Gen",
                         "product_type": "earbuds",
                         "release_date": "2022-09-23",
                         "price_range": "premium",
                         "chip": "H2",
-                        "form_factor": "wireless earbuds",
-                        "chunk_type": "spatial_audio_battery"
-                    }
+                        "form_factor": "wireless earbuds"
+                    },
+                    "chunks": [
+                        {
+                            "text": "AirPods Pro 2nd generation feature the H2 chip for enhanced Active Noise Cancellation and superior audio quality.",
+                            "chunk_type": "audio_technology"
+                        },
+                        {
+                            "text": "The AirPods Pro case supports MagSafe charging and includes a built-in speaker for Find My location tracking.",
+                            "chunk_type": "charging_features"
+                        },
+                        {
+                            "text": "AirPods Pro offer Spatial Audio with dynamic head tracking and up to 6 hours of listening time with ANC enabled.",
+                            "chunk_type": "spatial_audio_battery"
+                        }
+                    ]
                 }
             ],
             "ai": [
                 # ChatGPT/OpenAI chunks (3 chunks)
                 {
-                    "text": "ChatGPT is a conversational AI model developed by OpenAI based on the GPT (Generative Pre-trained Transformer) architecture.",
-                    "metadata": {
-                        "ai_name": "ChatGPT",
-                        "company": "OpenAI",
-                        "release_date": "2022-11-30",
-                        "model_type": "Large Language Model",
-                        "architecture": "Transformer",
-                        "use_cases": ["conversation", "writing", "coding"],
-                        "chunk_type": "overview"
-                    }
-                },
-                {
-                    "text": "ChatGPT uses reinforcement learning from human feedback (RLHF) to improve its responses and align with human preferences.",
-                    "metadata": {
-                        "ai_name": "ChatGPT",
-                        "company": "OpenAI",
-                        "release_date": "2022-11-30",
-                        "model_type": "Large Language Model",
-                        "architecture": "Transformer",
-                        "use_cases": ["conversation", "writing", "coding"],
-                        "chunk_type": "training_method"
-                    }
-                },
-                {
-                    "text": "ChatGPT can assist with various tasks including creative writing, code generation, problem-solving, and educational support.",
-                    "metadata": {
+                    "base": {
                         "ai_name": "ChatGPT",
                         "company": "OpenAI",
                         "release_date": "2022-11-30",
                         "model_type": "Large Language Model",
                         "architecture": "Transformer",
-                        "use_cases": ["conversation", "writing", "coding"],
-                        "chunk_type": "capabilities"
-                    }
+                        "use_cases": ["conversation", "writing", "coding"]
+                    },
+                    "chunks": [
+                        {
+                            "text": "ChatGPT is a conversational AI model developed by OpenAI based on the GPT (Generative Pre-trained Transformer) architecture.",
+                            "chunk_type": "overview"
+                        },
+                        {
+                            "text": "ChatGPT uses reinforcement learning from human feedback (RLHF) to improve its responses and align with human preferences.",
+                            "chunk_type": "training_method"
+                        },
+                        {
+                            "text": "ChatGPT can assist with various tasks including creative writing, code generation, problem-solving, and educational support.",
+                            "chunk_type": "capabilities"
+                        }
+                    ]
                 },
                 # Claude chunks (3 chunks)
                 {
-                    "text": "Claude is an AI assistant created by Anthropic, designed to be helpful, harmless, and honest in its interactions.",
-                    "metadata": {
-                        "ai_name": "Claude",
-                        "company": "Anthropic",
-                        "release_date": "2022-03-01",
-                        "model_type": "Large Language Model",
-                        "architecture": "Constitutional AI",
-                        "use_cases": ["analysis", "writing", "research"],
-                        "chunk_type": "overview"
-                    }
-                },
-                {
-                    "text": "Claude uses Constitutional AI training methods to reduce harmful outputs and improve alignment with human values.",
-                    "metadata": {
-                        "ai_name": "Claude",
-                        "company": "Anthropic",
-                        "release_date": "2022-03-01",
-                        "model_type": "Large Language Model",
-                        "architecture": "Constitutional AI",
-                        "use_cases": ["analysis", "writing", "research"],
-                        "chunk_type": "safety_approach"
-                    }
-                },
-                {
-                    "text": "Claude excels at complex reasoning, analysis, and maintaining context over long conversations with nuanced understanding.",
-                    "metadata": {
+                    "base": {
                         "ai_name": "Claude",
                         "company": "Anthropic",
                         "release_date": "2022-03-01",
                         "model_type": "Large Language Model",
                         "architecture": "Constitutional AI",
-                        "use_cases": ["analysis", "writing", "research"],
-                        "chunk_type": "strengths"
-                    }
+                        "use_cases": ["analysis", "writing", "research"]
+                    },
+                    "chunks": [
+                        {
+                            "text": "Claude is an AI assistant created by Anthropic, designed to be helpful, harmless, and honest in its interactions.",
+                            "chunk_type": "overview"
+                        },
+                        {
+                            "text": "Claude uses Constitutional AI training methods to reduce harmful outputs and improve alignment with human values.",
+                            "chunk_type": "safety_approach"
+                        },
+                        {
+                            "text": "Claude excels at complex reasoning, analysis, and maintaining context over long conversations with nuanced understanding.",
+                            "chunk_type": "strengths"
+                        }
+                    ]
                 },
                 # DALL-E chunks (2 chunks)
                 {
-                    "text": "DALL-E is an AI image generation model by OpenAI that creates images from textual descriptions using diffusion techniques.",
-                    "metadata": {
+                    "base": {
                         "ai_name": "DALL-E",
                         "company": "OpenAI",
                         "release_date": "2021-01-05",
                         "model_type": "Image Generation",
                         "architecture": "Diffusion Model",
-                        "use_cases": ["art creation", "design", "visualization"],
-                        "chunk_type": "technology_overview"
-                    }
-                },
-                {
-                    "text": "DALL-E 3 features improved prompt following, higher image quality, and better understanding of complex scene descriptions.",
-                    "metadata": {
-                        "ai_name": "DALL-E",
-                        "company": "OpenAI",
-                        "release_date": "2021-01-05",
-                        "model_type": "Image Generation",
-                        "architecture": "Diffusion Model",
-                        "use_cases": ["art creation", "design", "visualization"],
-                        "chunk_type": "latest_improvements"
-                    }
+                        "use_cases": ["art creation", "design", "visualization"]
+                    },
+                    "chunks": [
+                        {
+                            "text": "DALL-E is an AI image generation model by OpenAI that creates images from textual descriptions using diffusion techniques.",
+                            "chunk_type": "technology_overview"
+                        },
+                        {
+                            "text": "DALL-E 3 features improved prompt following, higher image quality, and better understanding of complex scene descriptions.",
+                            "chunk_type": "latest_improvements"
+                        }
+                    ]
                 },
                 # GitHub Copilot chunks (2 chunks)
                 {
-                    "text": "GitHub Copilot is an AI programming assistant developed by GitHub and OpenAI that suggests code completions in real-time.",
-                    "metadata": {
-                        "ai_name": "GitHub Copilot",
-                        "company": "GitHub",
-                        "release_date": "2021-06-29",
-                        "model_type": "Code Generation",
-                        "architecture": "Codex",
-                        "use_cases": ["code completion", "programming", "development"],
-                        "chunk_type": "functionality"
-                    }
-                },
-                {
-                    "text": "Copilot is trained on billions of lines of public code and can generate functions, classes, and entire programs from comments.",
-                    "metadata": {
+                    "base": {
                         "ai_name": "GitHub Copilot",
                         "company": "GitHub",
                         "release_date": "2021-06-29",
                         "model_type": "Code Generation",
                         "architecture": "Codex",
-                        "use_cases": ["code completion", "programming", "development"],
-                        "chunk_type": "training_capabilities"
-                    }
+                        "use_cases": ["code completion", "programming", "development"]
+                    },
+                    "chunks": [
+                        {
+                            "text": "GitHub Copilot is an AI programming assistant developed by GitHub and OpenAI that suggests code completions in real-time.",
+                            "chunk_type": "functionality"
+                        },
+                        {
+                            "text": "Copilot is trained on billions of lines of public code and can generate functions, classes, and entire programs from comments.",
+                            "chunk_type": "training_capabilities"
+                        }
+                    ]
                 }
             ]
         }
+        # Counted once here so the run summary doesn't re-walk the data
+        self._total_chunks = sum(len(item["chunks"]) for items in test_data.values() for item in items)
+        return test_data
+
+    @staticmethod
+    def _validate_chunks(chunks: List[Dict[str, Any]]):
+        """Check every chunk against the API's request schema before any HTTP call; reports all failures at once"""
+        errors = []
+        for position, chunk in enumerate(chunks):
+            try:
+                ChunkCreateRequest.model_validate(chunk)
+            except ValidationError as e:
+                errors.append(f"chunk {position}: {e}")
+        if errors:
+            raise ValueError(f"{len(errors)} invalid chunk(s) in test data:\n" + "\n".join(errors))
 
     async def create_library(self, name: str, index_type: str, metadata: Dict[str, Any] = None, index_params: Dict[str, Any] = None) -> str:
         """Create a library and return its ID"""
@@ -472,237 +482,300 @@ class VectorDBPopulator:
         
         print(f"Creating library: {name} with index type: {index_type}")
         
-        response = await self.client.post(
-            f"{self.base_url}/libraries/",
-            json=payload
-        )
+        response = await self._post_json("/libraries/", payload)
         
         if response.status_code != 201:
             print(f"Failed to create library {name}: {response.status_code} - {response.text}")
             raise Exception(f"Failed to create library: {response.text}")
         
-        library_data = response.json()
+        library_data = orjson.loads(response.content)
         library_id = library_data["id"]
         self.library_ids[name] = library_id
         print(f"✓ Created library {name} with ID: {library_id}")
         return library_id
 
-    async def create_chunk(self, library_id: str, text: str, metadata: Dict[str, Any]) -> str:
-        """Create a chunk in a library and return its ID"""
-        
-        # Generate embedding for the text with retry logic
-        print(f"Generating embedding for: {text[:50]}...")
-        
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in batches of MAX_BATCH_SIZE, preserving input order; cached texts are not re-sent"""
+        missing = []
+        for text in dict.fromkeys(texts):
+            if text in self._embed_cache:
+                continue
+            key = self._disk_cache_key(text)
+            if key in self._disk_cache:
+                self._embed_cache[text] = self._disk_cache[key]
+            else:
+                missing.append(text)
+
+        for start in range(0, len(missing), MAX_BATCH_SIZE):
+            batch = missing[start:start + MAX_BATCH_SIZE]
+            print(f"Generating embeddings for {len(batch)} texts...")
+            for text, embedding in zip(batch, await self._embed_batch_with_retry(batch)):
+                self._embed_cache[text] = embedding
+                self._disk_cache[self._disk_cache_key(text)] = embedding
+        return [self._embed_cache[text] for text in texts]
+
+    async def _embed_batch_with_retry(self, texts: List[str]) -> List[List[float]]:
+        """Embed a single batch, retrying rate limits and transient errors with backoff"""
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                embedding = self.embedder.embed(text, input_type="search_document", dimension=1024)
-                break
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "429" in error_msg or "rate" in error_msg:
-                    if attempt < max_retries - 1:
-                        if self._switch_api_key():
-                            print(f"Rate limited, switched API key, retrying...")
-                            continue
-                        else:
-                            print(f"Rate limited, waiting 60 seconds...")
-                            await asyncio.sleep(60)
-                            continue
-                    else:
-                        print(f"All API keys exhausted or rate limited")
-                        raise
-                else:
-                    print(f"Failed to generate embedding: {e}")
+                # The SDK call is blocking; run it off the event loop so uploads keep flowing
+                return await asyncio.to_thread(self.embedder.embed_batch, texts, input_type=EMBED_INPUT_TYPE, dimension=EMBED_DIMENSION)
+            except TooManyRequestsError:
+                if attempt == max_retries - 1:
+                    print(f"All API keys exhausted or rate limited")
                     raise
-        
-        # Add small delay to avoid hitting rate limits
-        await asyncio.sleep(1.5)
-        
+                if self._switch_api_key():
+                    print(f"Rate limited, switched API key, retrying...")
+                    continue
+                delay = min(60, 2 ** attempt + random.random())
+                print(f"Rate limited, waiting {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+            except (httpx.TimeoutException, ServiceUnavailableError, GatewayTimeoutError) as e:
+                if attempt == max_retries - 1:
+                    raise
+                delay = min(60, 2 ** attempt + random.random())
+                print(f"Embedding request failed ({type(e).__name__}), retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+
+    async def create_chunk(self, library_id: str, text: str, metadata: Dict[str, Any], embedding: Optional[List[float]] = None) -> str:
+        """Create a chunk in a library and return its ID"""
         payload = {
             "text": text,
             "metadata": metadata,
             "document_metadata": {}  # Will create a new document
         }
+
+        # Precomputed embeddings spare the server its own embedding call
+        if embedding is not None:
+            payload["embedding"] = embedding
         
-        response = await self.client.post(
-            f"{self.base_url}/libraries/{library_id}/chunks/",
-            json=payload
-        )
+        response = await self._post_json(f"/libraries/{library_id}/chunks/", payload)
         
         if response.status_code != 201:
             print(f"Failed to create chunk: {response.status_code} - {response.text}")
             raise Exception(f"Failed to create chunk: {response.text}")
         
-        chunk_data = response.json()
-        print(f"✓ Created chunk: {text[:30]}...")
+        chunk_data = orjson.loads(response.content)
         return chunk_data["id"]
 
+    async def create_chunks_bulk(self, library_id: str, items: List[Dict[str, Any]]) -> List[str]:
+        """Create many chunks in one request, deferring index insertion to the next build"""
+        async with self._upload_sem:
+            response = await self._post_json(
+                f"/libraries/{library_id}/chunks/bulk",
+                {"items": items, "defer_index": True},
+                compress=True
+            )
+
+        if response.status_code != 201:
+            print(f"Failed to create chunks: {response.status_code} - {response.text}")
+            raise Exception(f"Failed to create chunks: {response.text}")
+
+        return [chunk_data["id"] for chunk_data in orjson.loads(response.content)]
+
+    async def _bulk_add_chunks(self, library_id: str, chunks: List[Dict[str, Any]]) -> List[str]:
+        """Create chunks in BATCH_SIZE windows, one bulk request per window, preserving order"""
+        windows = [chunks[start:start + BATCH_SIZE] for start in range(0, len(chunks), BATCH_SIZE)]
+        results = await asyncio.gather(*[self.create_chunks_bulk(library_id, window) for window in windows])
+        return [chunk_id for window_ids in results for chunk_id in window_ids]
+
+    async def _create_chunk_guarded(self, sem: asyncio.Semaphore, library_id: str, text: str, metadata: Dict[str, Any], embedding: Optional[List[float]] = None) -> str:
+        """Create a chunk while holding a slot of the shared semaphore"""
+        async with sem:
+            return await self.create_chunk(library_id, text, metadata, embedding)
+
     async def build_index(self, library_id: str, library_name: str):
-        """Build index for a library"""
+        """Start a background index build for a library and wait until it is ready"""
         print(f"Building index for library: {library_name}")
         
         response = await self.client.post(
-            f"{self.base_url}/libraries/{library_id}/index"
+            f"/libraries/{library_id}/index/jobs"
         )
         
-        if response.status_code != 200:
+        if response.status_code != 202:
             print(f"Failed to build index for {library_name}: {response.status_code} - {response.text}")
             raise Exception(f"Failed to build index: {response.text}")
         
+        await self._wait_for_index_ready(library_id, orjson.loads(response.content)["job_id"])
         print(f"✓ Built index for library: {library_name}")
 
-    async def populate_library(self, library_name: str, library_id: str, topic_data: List[Dict[str, Any]]):
-        """Populate a library with chunks from topic data"""
-        print(f"\nPopulating library '{library_name}' with {len(topic_data)} chunks...")
-        
-        for i, chunk_data in enumerate(topic_data, 1):
-            print(f"  Adding chunk {i}/{len(topic_data)}")
-            await self.create_chunk(
-                library_id=library_id,
-                text=chunk_data["text"],
-                metadata=chunk_data["metadata"]
-            )
+    async def _wait_for_index_ready(self, library_id: str, job_id: str, timeout: float = 120.0):
+        """Poll the index build status with exponential backoff until the job finishes"""
+        delay = 0.05
+        deadline = time.monotonic() + timeout
+        while True:
+            response = await self.client.get(f"/libraries/{library_id}/index/status")
+            if response.status_code != 200:
+                raise Exception(f"Failed to get index status: {response.text}")
+
+            job = orjson.loads(response.content)
+            if job["job_id"] != job_id:
+                raise Exception(f"Index build {job_id} was superseded by {job['job_id']}")
+            if job["status"] == "ready":
+                return
+            if job["status"] == "failed":
+                raise Exception(f"Index build failed: {job['detail']}")
+            if time.monotonic() > deadline:
+                raise Exception(f"Timed out waiting for index build {job_id}")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 2.0)
+
+    async def populate_library(self, library_name: str, library_id: str, topic_data: List[Dict[str, Any]], bulk: bool = True):
+        """
+        Populate a library with chunks from topic data.
+        With bulk=True chunks go in BATCH_SIZE bulk requests and index insertion is
+        deferred to the following build_index call; otherwise chunks are POSTed one by one.
+        """
+        total = len(topic_data)
+        print(f"\nPopulating library '{library_name}' with {total} chunks...")
+
+        embeddings = await self.embed_texts([chunk_data["text"] for chunk_data in topic_data])
+
+        if bulk:
+            await self._bulk_add_chunks(library_id, [
+                {
+                    "text": chunk_data["text"],
+                    "metadata": chunk_data["metadata"],
+                    "embedding": embedding
+                }
+                for chunk_data, embedding in zip(topic_data, embeddings)
+            ])
+        else:
+            sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            await asyncio.gather(*[
+                self._create_chunk_guarded(sem, library_id, chunk_data["text"], chunk_data["metadata"], embedding)
+                for chunk_data, embedding in zip(topic_data, embeddings)
+            ])
+        print(f"✓ Created {total} chunks")
             
         print(f"✓ Completed populating library '{library_name}'")
 
+    async def _populate_and_index(self, library_id: str, lib_config: Dict[str, Any], test_data: Dict[str, List[Dict[str, Any]]]):
+        """Populate one library with its configured data and build its index"""
+        # Populate with chunks (use combined data for all libraries)
+        if lib_config["topic"] == "combined":
+            topic_data = lib_config["data"]
+        else:
+            topic_data = list(_expand(test_data[lib_config["topic"]]))
+        await self.populate_library(lib_config["name"], library_id, topic_data)
+        
+        # Build index
+        await self.build_index(library_id, lib_config["name"])
+
+    async def _create_and_populate(self, lib_config: Dict[str, Any], test_data: Dict[str, List[Dict[str, Any]]], embedded: "asyncio.Task[List[List[float]]]") -> str:
+        """Create one library, then populate and index it once the shared embeddings are ready"""
+        library_id = await self.create_library(
+            name=lib_config["name"],
+            index_type=lib_config["index_type"],
+            metadata=lib_config["metadata"],
+            index_params=lib_config.get("index_params")
+        )
+        # Populating only hits the embedding cache once this has finished
+        await embedded
+        await self._populate_and_index(library_id, lib_config, test_data)
+        return library_id
+
     async def run_population(self):
         """Main method to populate the database"""
         print("🚀 Starting Vector DB Population...")
         print("=" * 60)
         
-        try:
-            # Get test data
-            test_data = self.get_test_data()
-            
-            # Define libraries with SAME DATA but different index types for performance comparison
-            # Using combined dataset from all three topics for comprehensive testing
-            combined_topic_data = []
-            for topic_name, topic_chunks in test_data.items():
-                combined_topic_data.extend(topic_chunks)
-            
-            libraries_config = [
-                {
-                    "name": "Mixed Collection (Linear Index)",
-                    "index_type": "linear",
-                    "topic": "combined",
-                    "data": combined_topic_data,
-                    "metadata": {
-                        "description": "Mixed anime, Apple, and AI data with linear search index",
-                        "topics": ["anime", "apple", "ai"],
-                        "index_strategy": "linear",
-                        "total_chunks": len(combined_topic_data)
-                    }
+        # Get test data
+        test_data = self.get_test_data()
+        
+        # Define libraries with SAME DATA but different index types for performance comparison
+        # Using combined dataset from all three topics for comprehensive testing
+        combined_topic_data = []
+        for topic_name, topic_items in test_data.items():
+            combined_topic_data.extend(_expand(topic_items))
+        self._validate_chunks(combined_topic_data)
+        
+        libraries_config = [
+            {
+                "name": "Mixed Collection (Linear Index)",
+                "index_type": "linear",
+                "topic": "combined",
+                "data": combined_topic_data,
+                "metadata": {
+                    "description": "Mixed anime, Apple, and AI data with linear search index",
+                    "topics": ["anime", "apple", "ai"],
+                    "index_strategy": "linear",
+                    "total_chunks": len(combined_topic_data)
+                }
+            },
+            {
+                "name": "Mixed Collection (IVF Index)",
+                "index_type": "ivf", 
+                "topic": "combined",
+                "data": combined_topic_data,
+                "metadata": {
+                    "description": "Mixed anime, Apple, and AI data with IVF clustering index",
+                    "topics": ["anime", "apple", "ai"],
+                    "index_strategy": "ivf",
+                    "total_chunks": len(combined_topic_data)
                 },
-                {
-                    "name": "Mixed Collection (IVF Index)",
-                    "index_type": "ivf", 
-                    "topic": "combined",
-                    "data": combined_topic_data,
-                    "metadata": {
-                        "description": "Mixed anime, Apple, and AI data with IVF clustering index",
-                        "topics": ["anime", "apple", "ai"],
-                        "index_strategy": "ivf",
-                        "total_chunks": len(combined_topic_data)
-                    },
-                    "index_params": {
-                        "n_clusters": 6,  # 6 clusters for better distribution across topics
-                        "n_probes": 3
-                    }
+                "index_params": {
+                    "n_clusters": 6,  # 6 clusters for better distribution across topics
+                    "n_probes": 3
+                }
+            },
+            {
+                "name": "Mixed Collection (NSW Index)",
+                "index_type": "nsw",
+                "topic": "combined",
+                "data": combined_topic_data,
+                "metadata": {
+                    "description": "Mixed anime, Apple, and AI data with NSW graph index",
+                    "topics": ["anime", "apple", "ai"],
+                    "index_strategy": "nsw",
+                    "total_chunks": len(combined_topic_data)
                 },
-                {
-                    "name": "Mixed Collection (NSW Index)",
-                    "index_type": "nsw",
-                    "topic": "combined",
-                    "data": combined_topic_data,
-                    "metadata": {
-                        "description": "Mixed anime, Apple, and AI data with NSW graph index",
-                        "topics": ["anime", "apple", "ai"],
-                        "index_strategy": "nsw",
-                        "total_chunks": len(combined_topic_data)
-                    },
-                    "index_params": {
-                        "max_connections": 8,
-                        "ef_construction": 16
-                    }
+                "index_params": {
+                    "max_connections": 8,
+                    "ef_construction": 16
                 }
+            }
+        ]
+        
+        # Each library is populated as soon as it is created, overlapping with the other
+        # libraries' creation; embedding the shared dataset runs alongside library creation
+        print(f"\n📚 Creating {len(libraries_config)} libraries")
+        print("-" * 50)
+        # TaskGroups cancel the remaining tasks as soon as one fails
+        async with asyncio.TaskGroup() as tg:
+            embedded = tg.create_task(self.embed_texts([chunk_data["text"] for chunk_data in combined_topic_data]))
+            library_tasks = [
+                tg.create_task(self._create_and_populate(lib_config, test_data, embedded))
+                for lib_config in libraries_config
             ]
-            
-            # Create libraries and populate them
-            for lib_config in libraries_config:
-                print(f"\n📚 Processing {lib_config['name']}")
-                print("-" * 50)
-                
-                # Create library
-                library_id = await self.create_library(
-                    name=lib_config["name"],
-                    index_type=lib_config["index_type"],
-                    metadata=lib_config["metadata"],
-                    index_params=lib_config.get("index_params")
-                )
-                
-                # Populate with chunks (use combined data for all libraries)
-                if lib_config["topic"] == "combined":
-                    topic_data = lib_config["data"]
-                else:
-                    topic_data = test_data[lib_config["topic"]]
-                await self.populate_library(lib_config["name"], library_id, topic_data)
-                
-                # Build index
-                await self.build_index(library_id, lib_config["name"])
-            
-            print("\n" + "=" * 60)
-            print("🎉 Successfully populated Vector DB!")
-            print("\nCreated Libraries:")
-            for name, lib_id in self.library_ids.items():
-                print(f"  • {name}: {lib_id}")
-            
-            print(f"\nTotal chunks created: {sum(len(data) for data in test_data.values())}")
-            
-            # Print sample search queries for performance testing
-            print("\n🔍 Performance Comparison Queries:")
-            print("(Test the same queries across all three index types)")
-            
-            print("\n🎌 Anime Queries:")
-            print("  • 'psychological thriller anime' (should find Death Note chunks)")
-            print("  • 'giant creatures titans' (should find Attack on Titan chunks)")
-            print("  • 'demon slayer sword fighting' (should find Demon Slayer chunks)")
-            print("  • 'pirate adventure treasure' (should find One Piece chunks)")
-            
-            print("\n🍎 Apple Product Queries:")
-            print("  • 'titanium smartphone camera' (should find iPhone 15 Pro chunks)")
-            print("  • 'M2 chip laptop display' (should find MacBook Air chunks)")
-            print("  • 'wireless earbuds noise cancellation' (should find AirPods chunks)")
-            
-            print("\n🤖 AI Technology Queries:")
-            print("  • 'conversational AI chatbot' (should find ChatGPT chunks)")
-            print("  • 'Constitutional AI safety' (should find Claude chunks)")
-            print("  • 'image generation art' (should find DALL-E chunks)")
-            print("  • 'code completion programming' (should find GitHub Copilot chunks)")
-            
-            print("\n📊 Performance Testing Tips:")
-            print("  • Test search speed across Linear vs IVF vs NSW")
-            print("  • Compare result quality and ranking")
-            print("  • Try k=1, k=5, k=10 for different result counts")
-            print("  • Use metadata filters to test combined filtering + search")
-            
-            print("\n🔧 Metadata Filtering Examples:")
-            print("  • Filter by release_date > '2022-01-01'")
-            print("  • Filter by product_type = 'smartphone'")
-            print("  • Filter by company = 'OpenAI'")
-            print("  • Filter by chunk_type = 'overview'")
-            
-        except Exception as e:
-            print(f"❌ Error during population: {e}")
-            raise
+        library_ids = [task.result() for task in library_tasks]
+        # Keep the summary in config order rather than completion order
+        self.library_ids = {lib_config["name"]: library_id for lib_config, library_id in zip(libraries_config, library_ids)}
+        # Frozen (name, id) pairs for display; safe to share once all libraries exist
+        self._library_items = tuple(self.library_ids.items())
+        
+        # The whole success summary goes out in a single write
+        sys.stdout.write(_HELP_BANNER.format(
+            libraries="\n".join(f"  • {name}: {lib_id}" for name, lib_id in self._library_items),
+            total_chunks=self._total_chunks
+        ))
 
 async def main():
     """Main entry point"""
     populator = VectorDBPopulator()
     
     try:
-        # Check if the API is running
-        response = await populator.client.get(f"{BASE_URL.replace('/v1', '')}/health")
+        # Check if the API is running; retry so the script can be started alongside uvicorn
+        for attempt in range(HEALTH_CHECK_ATTEMPTS):
+            try:
+                response = await populator.client.get(populator.health_url, timeout=HEALTH_CHECK_TIMEOUT)
+                break
+            except httpx.ConnectError:
+                if attempt == HEALTH_CHECK_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(HEALTH_CHECK_BACKOFF * 2 ** attempt)
         if response.status_code != 200:
             print("❌ Vector DB API is not running!")
             print("Please start the API with: uvicorn app.main:app --reload")
@@ -717,10 +790,20 @@ async def main():
         print("❌ Cannot connect to Vector DB API!")
         print("Please ensure the API is running on http://localhost:8000")
         print("Start it with: uvicorn app.main:app --reload")
+    except ExceptionGroup as eg:
+        # Raised by run_population's task groups; report every failure, not just the first
+        for e in eg.exceptions:
+            print(f"❌ Error during population: {e}")
+    except httpx.TimeoutException:
+        print("❌ Vector DB API timed out!")
+        print("Please check that the API on http://localhost:8000 is responsive")
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
     finally:
         await populator.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
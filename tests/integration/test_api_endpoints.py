@@ -1,27 +1,57 @@
+import functools
+import gzip
+import json
+import uuid
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from uuid import uuid4
 
 from app.main import create_app
 from app.api import dependencies as di
+from app.api.middleware import MAX_DECOMPRESSED_BODY_BYTES
 from app.services.index_service import IndexService
+from app.services.chunk_service import ChunkService
+from app.services.document_service import DocumentService
+from app.services.library_service import LibraryService
 from app.repositories.memory.library_repository import InMemoryLibraryRepository
 from app.repositories.memory.document_repository import InMemoryDocumentRepository
 from app.repositories.memory.chunk_repository import InMemoryChunkRepository
 
+# Valid UUID that never names a stored entity; tests only need it to be absent
+BOGUS_UUID = "00000000-0000-4000-8000-000000000000"
+
+# Shared request body; never mutate it (a plain dict since orjson can't encode MappingProxyType)
+_EMPTY_META = {"metadata": {}}
+
+# Tagged chunks seeded by the search tests; shared like _EMPTY_META, never mutate it
+_SEARCH_SEED_ITEMS = [
+    {"text": text, "metadata": {"tag": tag}}
+    for text, tag in [("alpha", "x"), ("beta", "y"), ("gamma", "x"), ("delta", "z"), ("epsilon", "y")]
+]
+
+
+@functools.lru_cache(maxsize=512)
+def _fake_vector(text: str, dimension: int):
+    # Deterministic simple embedding to avoid external calls; tests reuse the same few strings
+    # Summing the encoded bytes runs in C; identical to summing ord() for ASCII text
+    base = sum(text.encode("utf-8")) % 100
+    return tuple((base + i) * 0.01 for i in range(dimension))
+
 
 class FakeEmbedding:
+    dimension = 32
+
     def embed(self, text: str, input_type: str = "search_document", dimension: int = 32):
-        # Deterministic simple embedding to avoid external calls
-        base = sum(ord(c) for c in text) % 100
-        return [(base + i) * 0.01 for i in range(dimension)]
+        # Fresh list per call so the cached tuple can't be mutated through a caller
+        return list(_fake_vector(text, dimension))
 
 
-@pytest.fixture
-def client():
+@pytest.fixture(scope="session")
+def app():
     app = create_app()
 
-    # Fresh in-memory singletons per test
+    # In-memory singletons shared by the whole session; reset_state clears them per test
     library_repo = InMemoryLibraryRepository()
     document_repo = InMemoryDocumentRepository()
     chunk_repo = InMemoryChunkRepository()
@@ -29,10 +59,6 @@ def client():
     index_service = IndexService(chunk_repo, embedding)
 
     # Rebuild services graph mirroring app.api.dependencies
-    from app.services.chunk_service import ChunkService
-    from app.services.document_service import DocumentService
-    from app.services.library_service import LibraryService
-
     chunk_service = ChunkService(
         chunk_repository=chunk_repo,
         library_repository=library_repo,
@@ -52,127 +78,188 @@ def client():
     )
 
     # Override DI providers
-    app.dependency_overrides[di.get_library_service] = lambda: library_service
-    app.dependency_overrides[di.get_document_service] = lambda: document_service
-    app.dependency_overrides[di.get_chunk_service] = lambda: chunk_service
-    app.dependency_overrides[di.get_index_service] = lambda: index_service
-
-    # Expose key services for introspection in tests
+    app.dependency_overrides[di.get_library_service] = lambda: app.state.library_service
+    app.dependency_overrides[di.get_document_service] = lambda: app.state.document_service
+    app.dependency_overrides[di.get_chunk_service] = lambda: app.state.chunk_service
+    app.dependency_overrides[di.get_index_service] = lambda: app.state.index_service
+
+    # Expose services and repositories for introspection and per-test reset
+    app.state.library_service = library_service
+    app.state.document_service = document_service
+    app.state.chunk_service = chunk_service
     app.state.index_service = index_service
+    app.state.repositories = (library_repo, document_repo, chunk_repo)
+
+    return app
+
+
+def post_json_ok(client, path, body, code=201):
+    """POST a JSON body, assert the status code and return the decoded response."""
+    # orjson on both directions; setup requests are the bulk of the suite's JSON traffic
+    r = client.post(path, content=orjson.dumps(body), headers={"content-type": "application/json"})
+    assert r.status_code == code, r.text
+    return orjson.loads(r.content)
+
+
+def _reset(app):
+    for repo in app.state.repositories:
+        repo.reset()
+    app.state.index_service.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_state(request, app):
+    # Classes with shared_state = True read class-scoped seed data; their seed fixture resets instead
+    if getattr(request.cls, "shared_state", False):
+        return
+    # Reset before (not after) each test so a failed test can't leak state into the next
+    _reset(app)
 
-    return TestClient(app)
+
+@pytest.fixture(scope="session")
+def client(app):
+    # Entered once so a single blocking portal (thread + event loop) serves every request.
+    # httpx.ASGITransport is async-only, so a plain sync httpx.Client can't replace TestClient here.
+    # Routes are addressed relative to the versioned prefix; /health lives at the root
+    with TestClient(app, base_url="http://testserver/v1") as client:
+        # Pay one-time costs (OpenAPI schema, first dispatch) here rather than in the first test
+        app.openapi()
+        client.get("http://testserver/health")
+        yield client
+
+
+@pytest.fixture(scope="session")
+def make_library(client):
+    """Factory creating a library and returning its response body."""
+    def make_library(index_type="linear", params=None, name="lib"):
+        return post_json_ok(client, "/libraries/", {"name": name, "index_type": index_type, "index_params": params or {}})
+
+    return make_library
+
+
+@pytest.fixture(scope="class")
+def linear_lib(app, client, make_library):
+    """Linear library with five tagged chunks, built once for a class of read-only tests."""
+    _reset(app)
+    lib_id = make_library()["id"]
+    # One bulk request; the single-chunk endpoint has its own tests
+    chunks = post_json_ok(client, f"/libraries/{lib_id}/chunks/bulk", {"items": _SEARCH_SEED_ITEMS})
+    # Build index (noop for linear)
+    assert client.post(f"/libraries/{lib_id}/index").status_code == 200
+    return lib_id, chunks
 
 
 def test_health(client):
-    r = client.get("/health")
+    r = client.get("http://testserver/health")
     assert r.status_code == 200
     assert r.json()["status"] == "healthy"
 
 
 class TestLibraries:
-    def test_create_library_success(self, client):
-        r = client.post("/v1/libraries/", json={"name": "lib1", "index_type": "linear", "metadata": {}})
+    @pytest.mark.parametrize("payload,expected_name,expected_index_type", [
+        ({"name": "lib1", "index_type": "linear", "metadata": {}}, "lib1", "linear"),
+        ({"name": "lib-ivf", "index_type": "ivf", "index_params": {"n_clusters": 2}}, "lib-ivf", "ivf"),
+        ({"name": "lib-nsw", "index_type": "nsw"}, "lib-nsw", "nsw"),
+        ({"name": "lib-default"}, "lib-default", "linear"),
+    ])
+    def test_create_library_success(self, client, payload, expected_name, expected_index_type):
+        r = client.post("/libraries/", json=payload)
         assert r.status_code == 201
         body = r.json()
-        assert body["name"] == "lib1"
-        assert body["index_type"] == "linear"
+        assert body["name"] == expected_name
+        assert body["index_type"] == expected_index_type
 
     def test_create_library_missing_body(self, client):
-        r = client.post("/v1/libraries/")
+        r = client.post("/libraries/")
         assert r.status_code == 422
 
-    def test_list_and_get_library(self, client):
-        r = client.post("/v1/libraries/", json={"name": "lib2", "index_type": "linear"})
-        lib_id = r.json()["id"]
-        r = client.get("/v1/libraries/")
+    def test_list_and_get_library(self, client, make_library):
+        lib_id = make_library(name="lib2")["id"]
+        r = client.get("/libraries/")
         assert r.status_code == 200
         assert lib_id in r.json()
-        r = client.get(f"/v1/libraries/{lib_id}")
+        r = client.get(f"/libraries/{lib_id}")
         assert r.status_code == 200
         assert r.json()["id"] == lib_id
 
     def test_get_library_not_found(self, client):
-        r = client.get(f"/v1/libraries/{uuid4()}")
+        r = client.get(f"/libraries/{BOGUS_UUID}")
         assert r.status_code == 404
 
-    def test_update_library_requires_some_field(self, client):
-        lib = client.post("/v1/libraries/", json={"name": "lib3", "index_type": "linear"}).json()
-        r = client.patch(f"/v1/libraries/{lib['id']}", json={})
+    def test_update_library_requires_some_field(self, client, make_library):
+        lib = make_library(name="lib3")
+        r = client.patch(f"/libraries/{lib['id']}", json={})
         # Pydantic validator should yield 422
         assert r.status_code == 422
 
-    def test_update_library_name_and_metadata(self, client):
-        lib = client.post("/v1/libraries/", json={"name": "lib4", "index_type": "linear"}).json()
+    def test_update_library_name_and_metadata(self, client, make_library):
+        lib = make_library(name="lib4")
         r = client.patch(
-            f"/v1/libraries/{lib['id']}", json={"name": "new", "metadata": {"a": 1}}
+            f"/libraries/{lib['id']}", json={"name": "new", "metadata": {"a": 1}}
         )
         assert r.status_code == 200
         body = r.json()
         assert body["name"] == "new"
         assert body["metadata"] == {"a": 1}
 
-    def test_delete_library_idempotent(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib5", "index_type": "linear"}).json()["id"]
-        r1 = client.delete(f"/v1/libraries/{lib_id}")
+    def test_delete_library_idempotent(self, client, make_library):
+        lib_id = make_library(name="lib5")["id"]
+        r1 = client.delete(f"/libraries/{lib_id}")
         assert r1.status_code == 200
-        r2 = client.delete(f"/v1/libraries/{lib_id}")
+        r2 = client.delete(f"/libraries/{lib_id}")
         # Service is idempotent; router returns 200 even if missing
         assert r2.status_code == 200
 
 
 class TestDocuments:
-    def setup_library(self, client):
-        return client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-
-    def test_create_document_success(self, client):
-        lib_id = self.setup_library(client)
-        r = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {"x": 1}})
+    def test_create_document_success(self, client, make_library):
+        lib_id = make_library()["id"]
+        r = client.post(f"/libraries/{lib_id}/documents/", json={"metadata": {"x": 1}})
         assert r.status_code == 201
         assert r.json()["library_id"] == lib_id
 
-    def test_create_document_missing_body(self, client):
-        lib_id = self.setup_library(client)
-        r = client.post(f"/v1/libraries/{lib_id}/documents/")
+    def test_create_document_missing_body(self, client, make_library):
+        lib_id = make_library()["id"]
+        r = client.post(f"/libraries/{lib_id}/documents/")
         assert r.status_code == 422
 
-    def test_get_document_not_found(self, client):
-        lib_id = self.setup_library(client)
-        r = client.get(f"/v1/libraries/{lib_id}/documents/{uuid4()}")
+    def test_get_document_not_found(self, client, make_library):
+        lib_id = make_library()["id"]
+        r = client.get(f"/libraries/{lib_id}/documents/{BOGUS_UUID}")
         assert r.status_code == 404
 
-    def test_update_document_success(self, client):
-        lib_id = self.setup_library(client)
-        doc = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {}}).json()
+    def test_update_document_success(self, client, make_library):
+        lib_id = make_library()["id"]
+        doc = post_json_ok(client, f"/libraries/{lib_id}/documents/", _EMPTY_META)
         r = client.patch(
-            f"/v1/libraries/{lib_id}/documents/{doc['id']}", json={"metadata": {"a": 2}}
+            f"/libraries/{lib_id}/documents/{doc['id']}", json={"metadata": {"a": 2}}
         )
         assert r.status_code == 200
         assert r.json()["metadata"] == {"a": 2}
 
-    def test_update_document_missing_body(self, client):
-        lib_id = self.setup_library(client)
-        doc = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {}}).json()
-        r = client.patch(f"/v1/libraries/{lib_id}/documents/{doc['id']}")
+    def test_update_document_missing_body(self, client, make_library):
+        lib_id = make_library()["id"]
+        doc = post_json_ok(client, f"/libraries/{lib_id}/documents/", _EMPTY_META)
+        r = client.patch(f"/libraries/{lib_id}/documents/{doc['id']}")
         assert r.status_code == 422
 
-    def test_delete_document_idempotent(self, client):
-        lib_id = self.setup_library(client)
-        doc_id = uuid4()
+    def test_delete_document_idempotent(self, client, make_library):
+        lib_id = make_library()["id"]
         # deleting non-existent should 404 per router? Router maps NotFoundError to 404
-        r = client.delete(f"/v1/libraries/{lib_id}/documents/{doc_id}")
+        r = client.delete(f"/libraries/{lib_id}/documents/{BOGUS_UUID}")
         assert r.status_code in (204, 404)
 
 
 class TestChunks:
-    def setup_library_and_doc(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        doc = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {}}).json()
+    def setup_library_and_doc(self, client, make_library):
+        lib_id = make_library()["id"]
+        doc = post_json_ok(client, f"/libraries/{lib_id}/documents/", _EMPTY_META)
         return lib_id, doc["id"]
 
-    def test_create_chunk_without_document_id_creates_doc(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
+    def test_create_chunk_without_document_id_creates_doc(self, client, make_library):
+        lib_id = make_library()["id"]
         r = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
+            f"/libraries/{lib_id}/chunks/",
             json={"text": "hello", "metadata": {"m": 1}},
         )
         assert r.status_code == 201
@@ -180,51 +267,179 @@ class TestChunks:
         assert body["library_id"] == lib_id
         assert body["text"] == "hello"
 
-    def test_create_chunk_with_document_id(self, client):
-        lib_id, doc_id = self.setup_library_and_doc(client)
+    def test_create_chunk_with_document_id(self, client, make_library):
+        lib_id, doc_id = self.setup_library_and_doc(client, make_library)
         r = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
+            f"/libraries/{lib_id}/chunks/",
             json={"text": "world", "metadata": {}, "document_id": doc_id},
         )
         assert r.status_code == 201
         assert r.json()["document_id"] == doc_id
 
-    def test_create_chunk_missing_body(self, client):
-        lib_id, _ = self.setup_library_and_doc(client)
-        r = client.post(f"/v1/libraries/{lib_id}/chunks/")
+    def test_create_chunk_with_precomputed_embedding(self, client, make_library):
+        lib_id = make_library()["id"]
+        # Stored under "beta" text but embedded as "alpha": search must use the provided vector
+        provided = client.post(
+            f"/libraries/{lib_id}/chunks/",
+            json={"text": "beta", "metadata": {}, "embedding": FakeEmbedding().embed("alpha")},
+        )
+        assert provided.status_code == 201
+        client.post(f"/libraries/{lib_id}/chunks/", json={"text": "gamma", "metadata": {}})
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 1})
+        assert r.status_code == 200
+        assert r.json()["results"][0]["chunk_id"] == provided.json()["id"]
+
+    def test_create_chunk_embedding_dimension_mismatch(self, client, make_library):
+        lib_id = make_library()["id"]
+        post_json_ok(client, f"/libraries/{lib_id}/chunks/", {"text": "alpha", "metadata": {}})
+        r = client.post(f"/libraries/{lib_id}/chunks/", json={"text": "beta", "embedding": [0.1, 0.2, 0.3]})
+        assert r.status_code == 400
+        r = client.post(
+            f"/libraries/{lib_id}/chunks/bulk",
+            json={"items": [{"text": "gamma"}, {"text": "delta", "embedding": [0.1, 0.2, 0.3]}]},
+        )
+        assert r.status_code == 400
+        # Search keeps working and only the valid chunk exists
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 5})
+        assert r.status_code == 200
+        assert [item["chunk"]["text"] for item in r.json()["results"]] == ["alpha"]
+
+    @pytest.mark.parametrize("embedding,expected", [
+        pytest.param([float("nan")] * FakeEmbedding.dimension, 422, id="nan"),
+        pytest.param([0.0] * FakeEmbedding.dimension, 400, id="zero"),
+    ])
+    def test_create_chunk_invalid_embedding_values(self, client, make_library, embedding, expected):
+        lib_id = make_library()["id"]
+        post_json_ok(client, f"/libraries/{lib_id}/chunks/", {"text": "alpha", "metadata": {}})
+        # Encoded with the stdlib so NaN goes out as a bare token, as a non-strict client would send it
+        headers = {"content-type": "application/json"}
+        r = client.post(
+            f"/libraries/{lib_id}/chunks/",
+            content=json.dumps({"text": "beta", "embedding": embedding}),
+            headers=headers,
+        )
+        assert r.status_code == expected
+        r = client.post(
+            f"/libraries/{lib_id}/chunks/bulk",
+            content=json.dumps({"items": [{"text": "gamma"}, {"text": "delta", "embedding": embedding}]}),
+            headers=headers,
+        )
+        assert r.status_code == expected
+        # Search keeps working and only the valid chunk exists
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 5})
+        assert r.status_code == 200
+        assert [item["chunk"]["text"] for item in r.json()["results"]] == ["alpha"]
+
+    def test_bulk_create_chunks(self, client, make_library):
+        lib_id = make_library()["id"]
+        r = client.post(
+            f"/libraries/{lib_id}/chunks/bulk",
+            json={"items": [{"text": "alpha", "metadata": {"m": 1}}, {"text": "beta"}]},
+        )
+        assert r.status_code == 201
+        body = r.json()
+        assert [c["text"] for c in body] == ["alpha", "beta"]
+        assert all(c["library_id"] == lib_id for c in body)
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 1})
+        assert r.json()["results"][0]["chunk_id"] == body[0]["id"]
+
+    def test_bulk_create_deferred_index_searchable_after_build(self, client, make_library):
+        lib_id = make_library("nsw")["id"]
+        created = client.post(
+            f"/libraries/{lib_id}/chunks/bulk",
+            json={"items": [{"text": "alpha"}, {"text": "beta"}], "defer_index": True},
+        ).json()
+        # Deleted before the build: must not reach the index
+        assert client.delete(f"/libraries/{lib_id}/chunks/{created[1]['id']}").status_code == 204
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 2})
+        assert r.json()["results"] == []
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 2})
+        assert [item["chunk_id"] for item in r.json()["results"]] == [created[0]["id"]]
+
+    def test_bulk_create_chunks_invalid_item_saves_nothing(self, client, make_library):
+        lib_id = make_library()["id"]
+        r = client.post(
+            f"/libraries/{lib_id}/chunks/bulk",
+            json={"items": [{"text": "alpha"}, {"text": "beta", "document_id": BOGUS_UUID}]},
+        )
+        assert r.status_code == 404
+        # The valid first item must not be stored (nor its auto-created document)
+        assert client.get(f"/libraries/{lib_id}").json()["documents"] == []
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 2})
+        assert r.json()["results"] == []
+
+    def test_bulk_create_chunks_gzip_body(self, client, make_library):
+        lib_id = make_library()["id"]
+        body = gzip.compress(json.dumps({"items": [{"text": "alpha"}, {"text": "beta"}]}).encode())
+        r = client.post(
+            f"/libraries/{lib_id}/chunks/bulk",
+            content=body,
+            headers={"content-type": "application/json", "content-encoding": "gzip"},
+        )
+        assert r.status_code == 201
+        assert [c["text"] for c in r.json()] == ["alpha", "beta"]
+
+        r = client.post(
+            f"/libraries/{lib_id}/chunks/bulk",
+            content=body[:-8],
+            headers={"content-type": "application/json", "content-encoding": "gzip"},
+        )
+        assert r.status_code == 400
+
+    def test_bulk_create_chunks_gzip_body_too_large(self, client, make_library):
+        lib_id = make_library()["id"]
+        # Compresses to a few hundred KB but inflates past the limit
+        body = gzip.compress(b" " * (MAX_DECOMPRESSED_BODY_BYTES + 1), compresslevel=1)
+        r = client.post(
+            f"/libraries/{lib_id}/chunks/bulk",
+            content=body,
+            headers={"content-type": "application/json", "content-encoding": "gzip"},
+        )
+        assert r.status_code == 413
+
+    def test_bulk_create_chunks_empty_items(self, client, make_library):
+        lib_id = make_library()["id"]
+        r = client.post(f"/libraries/{lib_id}/chunks/bulk", json={"items": []})
         assert r.status_code == 422
 
-    def test_get_chunk_without_document_id_optional(self, client):
-        lib_id, doc_id = self.setup_library_and_doc(client)
+    def test_create_chunk_missing_body(self, client, make_library):
+        lib_id, _ = self.setup_library_and_doc(client, make_library)
+        r = client.post(f"/libraries/{lib_id}/chunks/")
+        assert r.status_code == 422
+
+    def test_get_chunk_without_document_id_optional(self, client, make_library):
+        lib_id, doc_id = self.setup_library_and_doc(client, make_library)
         created = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
+            f"/libraries/{lib_id}/chunks/",
             json={"text": "x", "metadata": {}, "document_id": doc_id},
         ).json()
-        r = client.get(f"/v1/libraries/{lib_id}/chunks/{created['id']}")
+        r = client.get(f"/libraries/{lib_id}/chunks/{created['id']}")
         assert r.status_code == 200
         assert r.json()["id"] == created["id"]
 
-    def test_get_chunk_with_wrong_document_id_404(self, client):
-        lib_id, doc_id = self.setup_library_and_doc(client)
+    def test_get_chunk_with_wrong_document_id_404(self, client, make_library):
+        lib_id, doc_id = self.setup_library_and_doc(client, make_library)
         created = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
+            f"/libraries/{lib_id}/chunks/",
             json={"text": "x", "metadata": {}, "document_id": doc_id},
         ).json()
-        other_doc = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {}}).json()["id"]
+        other_doc = post_json_ok(client, f"/libraries/{lib_id}/documents/", _EMPTY_META)["id"]
         r = client.get(
-            f"/v1/libraries/{lib_id}/chunks/{created['id']}",
+            f"/libraries/{lib_id}/chunks/{created['id']}",
             params={"document_id": str(other_doc)},
         )
         assert r.status_code == 404
 
-    def test_update_chunk_text_and_metadata(self, client):
-        lib_id, doc_id = self.setup_library_and_doc(client)
+    def test_update_chunk_text_and_metadata(self, client, make_library):
+        lib_id, doc_id = self.setup_library_and_doc(client, make_library)
         created = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
+            f"/libraries/{lib_id}/chunks/",
             json={"text": "before", "metadata": {}, "document_id": doc_id},
         ).json()
         r = client.patch(
-            f"/v1/libraries/{lib_id}/chunks/{created['id']}",
+            f"/libraries/{lib_id}/chunks/{created['id']}",
             json={"text": "after", "metadata": {"a": 1}},
         )
         assert r.status_code == 200
@@ -232,63 +447,67 @@ class TestChunks:
         assert out["text"] == "after"
         assert out["metadata"] == {"a": 1}
 
-    def test_update_chunk_requires_some_field(self, client):
-        lib_id, doc_id = self.setup_library_and_doc(client)
+    def test_update_chunk_requires_some_field(self, client, make_library):
+        lib_id, doc_id = self.setup_library_and_doc(client, make_library)
         created = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
+            f"/libraries/{lib_id}/chunks/",
             json={"text": "x", "metadata": {}, "document_id": doc_id},
         ).json()
-        r = client.patch(f"/v1/libraries/{lib_id}/chunks/{created['id']}", json={})
+        r = client.patch(f"/libraries/{lib_id}/chunks/{created['id']}", json={})
         assert r.status_code == 422
 
-    def test_delete_chunk_idempotent(self, client):
-        lib_id, doc_id = self.setup_library_and_doc(client)
+    def test_delete_chunk_idempotent(self, client, make_library):
+        lib_id, doc_id = self.setup_library_and_doc(client, make_library)
         created = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
+            f"/libraries/{lib_id}/chunks/",
             json={"text": "x", "metadata": {}, "document_id": doc_id},
         ).json()
-        r1 = client.delete(f"/v1/libraries/{lib_id}/chunks/{created['id']}")
+        r1 = client.delete(f"/libraries/{lib_id}/chunks/{created['id']}")
         assert r1.status_code == 204
-        r2 = client.delete(f"/v1/libraries/{lib_id}/chunks/{created['id']}")
+        r2 = client.delete(f"/libraries/{lib_id}/chunks/{created['id']}")
         # Router returns 404 for missing chunk on delete
         assert r2.status_code in (204, 404)
 
 
 class TestIndex:
-    def test_build_index_success(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        r = client.post(f"/v1/libraries/{lib_id}/index")
+    def test_build_index_success(self, client, make_library):
+        lib_id = make_library()["id"]
+        r = client.post(f"/libraries/{lib_id}/index")
         # If no chunks added, build should still succeed
         assert r.status_code == 200
 
     def test_build_index_no_index_400(self, client):
         # Library without index in registry (simulate by new UUID)
-        r = client.post(f"/v1/libraries/{uuid4()}/index")
+        r = client.post(f"/libraries/{BOGUS_UUID}/index")
         assert r.status_code == 400
 
-
-class TestSearch:
-    def setup_library_with_chunks(self, client, index_type="linear", index_params=None):
-        lib = client.post("/v1/libraries/", json={"name": "lib", "index_type": index_type, "index_params": index_params or {}}).json()
-        lib_id = lib["id"]
-        created = []
-        for text, tag in [("alpha", "x"), ("beta", "y"), ("gamma", "x"), ("delta", "z"), ("epsilon", "y")]:
-            resp = client.post(
-                f"/v1/libraries/{lib_id}/chunks/",
-                json={"text": text, "metadata": {"tag": tag}},
-            )
-            assert resp.status_code == 201
-            created.append(resp.json())
-        return lib_id, created
-
-    def test_search_linear_top1_exact_match(self, client):
-        lib_id, chunks = self.setup_library_with_chunks(client, index_type="linear")
-        # Build index (noop for linear)
-        r = client.post(f"/v1/libraries/{lib_id}/index")
+    def test_background_build_job_reports_ready(self, client, make_library):
+        lib_id = make_library("ivf")["id"]
+        client.post(f"/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}})
+        # No job started yet
+        assert client.get(f"/libraries/{lib_id}/index/status").status_code == 404
+        r = client.post(f"/libraries/{lib_id}/index/jobs")
+        assert r.status_code == 202
+        job_id = r.json()["job_id"]
+        # TestClient runs background tasks before returning the response
+        r = client.get(f"/libraries/{lib_id}/index/status")
         assert r.status_code == 200
+        assert r.json()["job_id"] == job_id
+        assert r.json()["status"] == "ready"
+
+    def test_background_build_job_no_index_400(self, client):
+        assert client.post(f"/libraries/{BOGUS_UUID}/index/jobs").status_code == 400
+        assert client.get(f"/libraries/{BOGUS_UUID}/index/status").status_code == 400
+
 
+class TestLinearSearch:
+    # Tests here only read from linear_lib, so they share it instead of resetting per test
+    shared_state = True
+
+    def test_search_linear_top1_exact_match(self, client, linear_lib):
+        lib_id, chunks = linear_lib
         r = client.post(
-            f"/v1/libraries/{lib_id}/search",
+            f"/libraries/{lib_id}/search",
             json={"query": "alpha", "k": 3},
         )
         assert r.status_code == 200
@@ -296,14 +515,11 @@ class TestSearch:
         assert len(results) >= 1
         assert results[0]["chunk_id"] == chunks[0]["id"]
 
-    def test_search_linear_with_filters(self, client):
-        lib_id, chunks = self.setup_library_with_chunks(client, index_type="linear")
-        r = client.post(f"/v1/libraries/{lib_id}/index")
-        assert r.status_code == 200
-
+    def test_search_linear_with_filters(self, client, linear_lib):
+        lib_id, chunks = linear_lib
         # Query doesn't matter for filter membership; ensure only 'tag' == 'x' returned
         r = client.post(
-            f"/v1/libraries/{lib_id}/search",
+            f"/libraries/{lib_id}/search",
             json={"query": "random-query", "k": 5, "filters": {"tag": "x"}},
         )
         assert r.status_code == 200
@@ -312,66 +528,49 @@ class TestSearch:
         assert returned_ids.issubset(ids_with_tag_x)
         assert len(returned_ids) == len(ids_with_tag_x)
 
-    def test_search_no_index_in_registry_returns_500(self, client):
-        from uuid import uuid4
-        bogus_lib_id = uuid4()
-        r = client.post(
-            f"/v1/libraries/{bogus_lib_id}/search",
-            json={"query": "q", "k": 2},
-        )
-        assert r.status_code == 400  # IndexError returns 400, not 500
-
-    def test_search_linear_invalid_k_zero_and_negative(self, client):
-        lib_id, _ = self.setup_library_with_chunks(client, index_type="linear")
-        r = client.post(f"/v1/libraries/{lib_id}/index")
-        assert r.status_code == 200
+    def test_search_linear_invalid_k_zero_and_negative(self, client, linear_lib):
+        lib_id, _ = linear_lib
         # k == 0
         r0 = client.post(
-            f"/v1/libraries/{lib_id}/search",
+            f"/libraries/{lib_id}/search",
             json={"query": "q", "k": 0},
         )
         assert r0.status_code == 422
         # k < 0
         rneg = client.post(
-            f"/v1/libraries/{lib_id}/search",
+            f"/libraries/{lib_id}/search",
             json={"query": "q", "k": -1},
         )
         assert rneg.status_code == 422
 
-    def test_create_linear_with_unused_index_params_and_search(self, client):
-        lib = client.post(
-            "/v1/libraries/",
-            json={"name": "lin-extra", "index_type": "linear", "index_params": {"n_clusters": 10, "foo": "bar"}},
-        ).json()
-        lib_id = lib["id"]
+
+class TestSearch:
+    def test_search_no_index_in_registry_returns_500(self, client):
+        r = client.post(
+            f"/libraries/{BOGUS_UUID}/search",
+            json={"query": "q", "k": 2},
+        )
+        assert r.status_code == 400  # IndexError returns 400, not 500
+
+    def test_create_linear_with_unused_index_params_and_search(self, client, make_library):
+        lib_id = make_library("linear", {"n_clusters": 10, "foo": "bar"}, name="lin-extra")["id"]
         # Works end-to-end even if params are unused by LinearIndex
-        client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}})
-        assert client.post(f"/v1/libraries/{lib_id}/index").status_code == 200
-        r = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "alpha", "k": 1})
+        client.post(f"/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}})
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 1})
         assert r.status_code == 200
         assert len(r.json()["results"]) == 1
 
-    def test_search_nsw_basic_flow(self, client):
-        lib = client.post(
-            "/v1/libraries/",
-            json={"name": "nsw-lib", "index_type": "nsw", "index_params": {"m": 6, "efConstruction": 16, "efSearch": 32}},
-        ).json()
-        lib_id = lib["id"]
-        created = []
-        for text, tag in [("alpha", "x"), ("beta", "y"), ("gamma", "x"), ("delta", "z"), ("epsilon", "y")]:
-            resp = client.post(
-                f"/v1/libraries/{lib_id}/chunks/",
-                json={"text": text, "metadata": {"tag": tag}},
-            )
-            assert resp.status_code == 201
-            created.append(resp.json())
+    def test_search_nsw_basic_flow(self, client, make_library):
+        lib_id = make_library("nsw", {"m": 6, "efConstruction": 16, "efSearch": 32}, name="nsw-lib")["id"]
+        created = post_json_ok(client, f"/libraries/{lib_id}/chunks/bulk", {"items": _SEARCH_SEED_ITEMS})
 
         # NSW index() is a no-op, but call to ensure endpoint works
-        assert client.post(f"/v1/libraries/{lib_id}/index").status_code == 200
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
 
         # Query for exact 'gamma' match
         r = client.post(
-            f"/v1/libraries/{lib_id}/search",
+            f"/libraries/{lib_id}/search",
             json={"query": "gamma", "k": 3},
         )
         assert r.status_code == 200
@@ -380,23 +579,12 @@ class TestSearch:
         gamma_id = next(c["id"] for c in created if c["text"] == "gamma")
         assert results[0]["chunk_id"] == gamma_id
 
-    def test_search_nsw_with_filters(self, client):
-        lib = client.post(
-            "/v1/libraries/",
-            json={"name": "nsw-lib2", "index_type": "nsw"},
-        ).json()
-        lib_id = lib["id"]
-        created = []
-        for text, tag in [("alpha", "x"), ("beta", "y"), ("gamma", "x"), ("delta", "z")]:
-            created.append(
-                client.post(
-                    f"/v1/libraries/{lib_id}/chunks/",
-                    json={"text": text, "metadata": {"tag": tag}},
-                ).json()
-            )
+    def test_search_nsw_with_filters(self, client, make_library):
+        lib_id = make_library("nsw", name="nsw-lib2")["id"]
+        created = post_json_ok(client, f"/libraries/{lib_id}/chunks/bulk", {"items": _SEARCH_SEED_ITEMS})
 
         r = client.post(
-            f"/v1/libraries/{lib_id}/search",
+            f"/libraries/{lib_id}/search",
             json={"query": "random", "k": 5, "filters": {"tag": "x"}},
         )
         assert r.status_code == 200
@@ -405,22 +593,18 @@ class TestSearch:
         assert returned.issubset(ids_with_tag_x)
         assert len(returned) == len(ids_with_tag_x)
 
-    def test_nsw_update_and_search(self, client):
-        lib = client.post(
-            "/v1/libraries/",
-            json={"name": "nsw-lib3", "index_type": "nsw"},
-        ).json()
-        lib_id = lib["id"]
+    def test_nsw_update_and_search(self, client, make_library):
+        lib_id = make_library("nsw", name="nsw-lib3")["id"]
         c = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
+            f"/libraries/{lib_id}/chunks/",
             json={"text": "old", "metadata": {}},
         ).json()
         # index is no-op
-        assert client.post(f"/v1/libraries/{lib_id}/index").status_code == 200
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
         # update chunk text
-        assert client.patch(f"/v1/libraries/{lib_id}/chunks/{c['id']}", json={"text": "new"}).status_code == 200
+        assert client.patch(f"/libraries/{lib_id}/chunks/{c['id']}", json={"text": "new"}).status_code == 200
         r = client.post(
-            f"/v1/libraries/{lib_id}/search",
+            f"/libraries/{lib_id}/search",
             json={"query": "new", "k": 1},
         )
         assert r.status_code == 200
@@ -429,189 +613,136 @@ class TestSearch:
 class TestIVF:
     def test_create_library_ivf_and_index_params_echoed(self, client):
         params = {"n_clusters": 2, "n_probes": 1, "cluster_ratio": 0.5, "probe_ratio": 0.4, "multiplier": 4}
-        r = client.post("/v1/libraries/", json={"name": "ivf-lib", "index_type": "ivf", "index_params": params})
+        r = client.post("/libraries/", json={"name": "ivf-lib", "index_type": "ivf", "index_params": params})
         assert r.status_code == 201
         body = r.json()
         assert body["index_type"] == "ivf"
         # index_params stored on library
         assert body.get("index_params") == params
 
-    def test_ivf_search_without_build_uses_unprocessed(self, client):
-        lib = client.post("/v1/libraries/", json={"name": "ivf-lib", "index_type": "ivf"}).json()
+    def test_ivf_search_without_build_uses_unprocessed(self, client, make_library):
+        lib = make_library("ivf", name="ivf-lib")
         lib_id = lib["id"]
         # Add chunks but DO NOT build index
-        a = client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}}).json()
-        b = client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "beta", "metadata": {}}).json()
-        r = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "alpha", "k": 2})
+        a = post_json_ok(client, f"/libraries/{lib_id}/chunks/", {"text": "alpha", "metadata": {}})
+        b = post_json_ok(client, f"/libraries/{lib_id}/chunks/", {"text": "beta", "metadata": {}})
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 2})
         assert r.status_code == 200
         top = r.json()["results"][0]["chunk_id"]
         assert top == a["id"]
 
-    def test_ivf_build_and_search_after_ratio(self, client):
+    def test_ivf_build_and_search_after_ratio(self, client, make_library):
         # Create IVF with ratio to determine cluster count (black-box behavior)
         params = {"cluster_ratio": 0.5}
-        lib = client.post("/v1/libraries/", json={"name": "ivf-lib", "index_type": "ivf", "index_params": params}).json()
+        lib = make_library("ivf", params, name="ivf-lib")
         lib_id = lib["id"]
         # Add 10 chunks
-        for i in range(10):
-            r = client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": f"t{i}", "metadata": {}})
-            assert r.status_code == 201
+        post_json_ok(client, f"/libraries/{lib_id}/chunks/bulk", {"items": [{"text": f"t{i}", "metadata": {}} for i in range(10)]})
         # Build index
-        r = client.post(f"/v1/libraries/{lib_id}/index")
+        r = client.post(f"/libraries/{lib_id}/index")
         assert r.status_code == 200
         # Perform a search and ensure sensible results length and validity
-        r = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "t5", "k": 3})
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "t5", "k": 3})
         assert r.status_code == 200
         results = r.json()["results"]
         assert 1 <= len(results) <= 3
         # Returned chunk_ids should be valid UUID strings
-        import uuid
         for item in results:
             uuid.UUID(item["chunk_id"])  # will raise if invalid
 
-    def test_ivf_search_top1_exact_after_build(self, client):
-        lib = client.post("/v1/libraries/", json={"name": "ivf-lib", "index_type": "ivf", "index_params": {"n_probes": 2}}).json()
+    def test_ivf_search_top1_exact_after_build(self, client, make_library):
+        lib = make_library("ivf", {"n_probes": 2}, name="ivf-lib")
         lib_id = lib["id"]
-        created = []
-        for text in ["alpha", "beta", "gamma", "delta", "epsilon"]:
-            created.append(client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": text, "metadata": {}}).json())
-        r = client.post(f"/v1/libraries/{lib_id}/index")
+        items = [{"text": text, "metadata": {}} for text in ["alpha", "beta", "gamma", "delta", "epsilon"]]
+        created = post_json_ok(client, f"/libraries/{lib_id}/chunks/bulk", {"items": items})
+        r = client.post(f"/libraries/{lib_id}/index")
         assert r.status_code == 200
 
-        r = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "gamma", "k": 3})
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "gamma", "k": 3})
         assert r.status_code == 200
         top = r.json()["results"][0]["chunk_id"]
         gamma_id = next(c["id"] for c in created if c["text"] == "gamma")
         assert top == gamma_id
 
-    def test_ivf_update_chunk_and_rebuild_affects_results(self, client):
-        lib = client.post("/v1/libraries/", json={"name": "ivf-lib", "index_type": "ivf"}).json()
+    def test_ivf_update_chunk_and_rebuild_affects_results(self, client, make_library):
+        lib = make_library("ivf", name="ivf-lib")
         lib_id = lib["id"]
-        c = client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "old", "metadata": {}}).json()
+        c = post_json_ok(client, f"/libraries/{lib_id}/chunks/", {"text": "old", "metadata": {}})
         # Build index initially
-        assert client.post(f"/v1/libraries/{lib_id}/index").status_code == 200
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
         # Update chunk text (embedding changes)
-        r = client.patch(f"/v1/libraries/{lib_id}/chunks/{c['id']}", json={"text": "zzz"})
+        r = client.patch(f"/libraries/{lib_id}/chunks/{c['id']}", json={"text": "zzz"})
         assert r.status_code == 200
         # Rebuild IVF to re-cluster
-        assert client.post(f"/v1/libraries/{lib_id}/index").status_code == 200
-        r = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "zzz", "k": 1})
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "zzz", "k": 1})
         assert r.status_code == 200
         assert r.json()["results"][0]["chunk_id"] == c["id"]
 
-    def test_ivf_search_when_k_exceeds_available(self, client):
-        lib = client.post("/v1/libraries/", json={"name": "ivf-lib", "index_type": "ivf"}).json()
+    def test_ivf_search_when_k_exceeds_available(self, client, make_library):
+        lib = make_library("ivf", name="ivf-lib")
         lib_id = lib["id"]
-        a = client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}}).json()
-        b = client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "beta", "metadata": {}}).json()
-        assert client.post(f"/v1/libraries/{lib_id}/index").status_code == 200
-        r = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "alpha", "k": 10})
+        a = post_json_ok(client, f"/libraries/{lib_id}/chunks/", {"text": "alpha", "metadata": {}})
+        b = post_json_ok(client, f"/libraries/{lib_id}/chunks/", {"text": "beta", "metadata": {}})
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 10})
         assert r.status_code == 200
         results = r.json()["results"]
         assert len(results) == 2
 
-    def test_ivf_invalid_k_zero_and_negative(self, client):
-        lib = client.post("/v1/libraries/", json={"name": "ivf-k", "index_type": "ivf"}).json()
+    def test_ivf_invalid_k_zero_and_negative(self, client, make_library):
+        lib = make_library("ivf", name="ivf-k")
         lib_id = lib["id"]
-        r0 = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "alpha", "k": 0})
+        r0 = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 0})
         assert r0.status_code == 422
-        rneg = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "alpha", "k": -5})
+        rneg = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": -5})
         assert rneg.status_code == 422
 
-    def test_ivf_negative_params_are_clamped_and_search_works(self, client):
+    def test_ivf_negative_params_are_clamped_and_search_works(self, client, make_library):
         params = {"n_clusters": -5, "n_probes": -2, "cluster_ratio": -0.5, "probe_ratio": -0.1, "multiplier": -3}
-        lib = client.post("/v1/libraries/", json={"name": "ivf-neg", "index_type": "ivf", "index_params": params}).json()
+        lib = make_library("ivf", params, name="ivf-neg")
         lib_id = lib["id"]
-        client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}})
-        client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "beta", "metadata": {}})
-        assert client.post(f"/v1/libraries/{lib_id}/index").status_code == 200
+        client.post(f"/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}})
+        client.post(f"/libraries/{lib_id}/chunks/", json={"text": "beta", "metadata": {}})
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
 
-        r = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "alpha", "k": 2})
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 2})
         assert r.status_code == 200
         assert len(r.json()["results"]) >= 1
 
-    def test_ivf_unknown_params_ignored_and_search_works(self, client):
+    def test_ivf_unknown_params_ignored_and_search_works(self, client, make_library):
         params = {"unknown": "x", "also_bad": 123}
-        lib = client.post("/v1/libraries/", json={"name": "ivf-unknown", "index_type": "ivf", "index_params": params}).json()
+        lib = make_library("ivf", params, name="ivf-unknown")
         lib_id = lib["id"]
-        client.post(f"/v1/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}})
-        assert client.post(f"/v1/libraries/{lib_id}/index").status_code == 200
-        r = client.post(f"/v1/libraries/{lib_id}/search", json={"query": "alpha", "k": 1})
+        client.post(f"/libraries/{lib_id}/chunks/", json={"text": "alpha", "metadata": {}})
+        assert client.post(f"/libraries/{lib_id}/index").status_code == 200
+        r = client.post(f"/libraries/{lib_id}/search", json={"query": "alpha", "k": 1})
         assert r.status_code == 200
         assert len(r.json()["results"]) == 1
 
 class TestBadInputs:
-    def test_create_library_invalid_enum(self, client):
-        r = client.post("/v1/libraries/", json={"name": "x", "index_type": "invalid"})
-        assert r.status_code == 422
-
-    def test_create_library_malformed_json(self, client):
-        r = client.post(
-            "/v1/libraries/",
-            data="{not-json}",
-            headers={"Content-Type": "application/json"},
-        )
-        assert r.status_code == 422
-
-    def test_get_library_invalid_uuid(self, client):
-        r = client.get("/v1/libraries/not-a-uuid")
-        assert r.status_code == 422
-
-    def test_create_chunk_missing_text(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        r = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
-            json={"metadata": {"a": 1}},
-        )
-        assert r.status_code == 422
-
-    def test_update_chunk_empty_text(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        doc = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {}}).json()
-        created = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
-            json={"text": "ok", "metadata": {}, "document_id": doc["id"]},
-        ).json()
-        r = client.patch(
-            f"/v1/libraries/{lib_id}/chunks/{created['id']}",
-            json={"text": ""},
-        )
-        assert r.status_code == 422
-
-    def test_get_chunk_invalid_document_id_query(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        doc = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {}}).json()
-        created = client.post(
-            f"/v1/libraries/{lib_id}/chunks/",
-            json={"text": "ok", "metadata": {}, "document_id": doc["id"]},
-        ).json()
-        r = client.get(
-            f"/v1/libraries/{lib_id}/chunks/{created['id']}", params={"document_id": "not-a-uuid"}
-        )
-        assert r.status_code == 422
-
-    def test_create_document_wrong_body_type(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        r = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": "not-a-dict"})
-        assert r.status_code == 422
-
-    def test_update_document_wrong_body_type(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        doc = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {}}).json()
-        r = client.patch(
-            f"/v1/libraries/{lib_id}/documents/{doc['id']}", json={"metadata": "not-a-dict"}
-        )
-        assert r.status_code == 422
-
-    def test_delete_document_not_found_returns_204(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        r = client.delete(f"/v1/libraries/{lib_id}/documents/{uuid4()}" )
-        assert r.status_code == 204
-
-    def test_delete_chunk_not_found_returns_204(self, client):
-        lib_id = client.post("/v1/libraries/", json={"name": "lib", "index_type": "linear"}).json()["id"]
-        doc = client.post(f"/v1/libraries/{lib_id}/documents/", json={"metadata": {}}).json()
-        r = client.delete(f"/v1/libraries/{lib_id}/chunks/{uuid4()}" )
-        assert r.status_code == 204
+    # Paths are templates over {lib}, {doc}, {chunk} and {bogus}; each row seeds only what its path names
+    @pytest.mark.parametrize("method,path,kwargs,expected", [
+        pytest.param("POST", "/libraries/", {"json": {"name": "x", "index_type": "invalid"}}, 422, id="create_library_invalid_enum"),
+        pytest.param("POST", "/libraries/", {"content": "{not-json}", "headers": {"Content-Type": "application/json"}}, 422, id="create_library_malformed_json"),
+        pytest.param("GET", "/libraries/not-a-uuid", {}, 422, id="get_library_invalid_uuid"),
+        pytest.param("POST", "/libraries/{lib}/chunks/", {"json": {"metadata": {"a": 1}}}, 422, id="create_chunk_missing_text"),
+        pytest.param("PATCH", "/libraries/{lib}/chunks/{chunk}", {"json": {"text": ""}}, 422, id="update_chunk_empty_text"),
+        pytest.param("GET", "/libraries/{lib}/chunks/{chunk}", {"params": {"document_id": "not-a-uuid"}}, 422, id="get_chunk_invalid_document_id_query"),
+        pytest.param("POST", "/libraries/{lib}/documents/", {"json": {"metadata": "not-a-dict"}}, 422, id="create_document_wrong_body_type"),
+        pytest.param("PATCH", "/libraries/{lib}/documents/{doc}", {"json": {"metadata": "not-a-dict"}}, 422, id="update_document_wrong_body_type"),
+        pytest.param("DELETE", "/libraries/{lib}/documents/{bogus}", {}, 204, id="delete_document_not_found_returns_204"),
+        pytest.param("DELETE", "/libraries/{lib}/chunks/{bogus}", {}, 204, id="delete_chunk_not_found_returns_204"),
+    ])
+    def test_bad_input(self, client, make_library, method, path, kwargs, expected):
+        ids = {"bogus": BOGUS_UUID}
+        if "{lib}" in path:
+            ids["lib"] = make_library()["id"]
+        if "{doc}" in path:
+            ids["doc"] = post_json_ok(client, f"/libraries/{ids['lib']}/documents/", _EMPTY_META)["id"]
+        if "{chunk}" in path:
+            ids["chunk"] = post_json_ok(client, f"/libraries/{ids['lib']}/chunks/", {"text": "ok", "metadata": {}})["id"]
+        r = client.request(method, path.format(**ids), **kwargs)
+        assert r.status_code == expected
 
 
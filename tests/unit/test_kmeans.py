@@ -0,0 +1,41 @@
+import numpy as np
+
+from app.utils.helper_functions.kmeans import KMeans
+
+
+def make_blobs(n_per_cluster=50, dim=16, n_clusters=4, seed=0):
+    # Well-separated clusters along distinct axes, so cosine assignment is unambiguous
+    rng = np.random.default_rng(seed)
+    centers = np.eye(dim)[:n_clusters] * 10.0
+    points = [center + rng.normal(scale=0.5, size=(n_per_cluster, dim)) for center in centers]
+    return np.vstack(points)
+
+
+def test_float32_sims_labels_match_float64():
+    X = make_blobs()
+    np.random.seed(0)
+    _, labels64 = KMeans(4, float32_sims=False).fit(X, return_arrays=True)
+    np.random.seed(0)
+    _, labels32 = KMeans(4, float32_sims=True).fit(X, return_arrays=True)
+    assert np.array_equal(labels32, labels64)
+
+
+def test_centroids_are_per_cluster_means_of_final_labels():
+    X = make_blobs(n_clusters=4, seed=1)
+    np.random.seed(1)
+    centroids, labels = KMeans(4, max_iters=3, tol=0.0).fit(X, return_arrays=True)
+    for c in range(4):
+        members = X[labels == c]
+        assert len(members) > 0
+        np.testing.assert_allclose(centroids[c], members.mean(axis=0))
+
+
+def test_empty_cluster_reseeded_with_farthest_point(monkeypatch):
+    # Seeding both centroids on the same point makes every point tie to cluster 0, leaving cluster 1 empty
+    X = np.array([[1.0, 0.0], [1.0, 0.0], [1.0, 0.1], [0.0, 1.0]])
+    monkeypatch.setattr(np.random, "choice", lambda n, size, replace: np.array([0, 1]))
+    centroids, labels = KMeans(2, max_iters=1).fit(X, return_arrays=True)
+    assert labels.tolist() == [0, 0, 0, 0]
+    np.testing.assert_allclose(centroids[0], X.mean(axis=0))
+    # [0, 1] is the point farthest (cosine) from its assigned centroid
+    np.testing.assert_allclose(centroids[1], [0.0, 1.0])